@@ -1,11 +1,13 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 import random
+import numpy as np
 from player import Player, PlayerManager
 from terrain import TerrainManager
 from military import MilitaryManager
 
-@dataclass
+@dataclass(slots=True)
 class AISettings:
     food_weight: float = 1.0
     production_weight: float = 1.0
@@ -36,11 +38,86 @@ class AISettings:
     university_priority: float = 0.3
     
     # Science priorities
-    science_priorities: List[float] = None
-    
+    science_priorities: Tuple[float, ...] = None
+
     def __post_init__(self):
         if self.science_priorities is None:
-            self.science_priorities = [0.2] * 6  # Equal priority for all sciences
+            self.science_priorities = (0.2,) * 6  # Equal priority for all sciences
+
+class AISettingsCache(dict):
+    """Dict of filename -> AISettings that parses a personality file on
+    first access instead of loading every .ai file up front"""
+
+    def __missing__(self, filename: str) -> AISettings:
+        try:
+            settings = _parse_ai_file(filename)
+        except Exception as e:
+            print(f"Error loading {filename}: {e}")
+            if filename != "default.ai":
+                settings = self["default.ai"]
+            else:
+                settings = AISettings()
+        self[filename] = settings
+        return settings
+
+@lru_cache(maxsize=32)
+def _read_ai_values(filename: str) -> Tuple[float, ...]:
+    """Slurp an .ai file into floats once; repeat loads hit the cache
+
+    Parsing stops at the first non-numeric token, since .ai files end
+    with a free-text description of the personality.
+    """
+    values = []
+    with open(filename, "r") as f:
+        for token in f.read().split():
+            try:
+                values.append(float(token))
+            except ValueError:
+                break
+    return tuple(values)
+
+def _parse_ai_file(filename: str) -> AISettings:
+    """Parse a single AI settings file"""
+    settings = AISettings()
+
+    values = iter(_read_ai_values(filename))
+
+    # Read basic weights
+    settings.food_weight = next(values)
+    settings.production_weight = next(values)
+    settings.hate_weight = next(values)
+    settings.diplomacy_weight = next(values)
+    settings.friendliness = next(values)
+    settings.chance = next(values)
+    settings.trust_weight = next(values)
+    settings.remote_weight = next(values)
+    settings.min_trust = next(values)
+
+    # Read diplomatic thresholds
+    settings.trade_threshold = next(values)
+    settings.friend_threshold = next(values)
+    settings.ally_threshold = next(values)
+
+    # Read other settings
+    settings.min_morale = next(values)
+    settings.min_tax = next(values)
+
+    # Skip fear diplomacy levels
+    _ = [next(values) for _ in range(5)]  # fear_dipl values
+
+    # Read military and building settings
+    settings.war_military_spending = next(values)
+    settings.peace_military_spending = next(values)
+    settings.building_chance = next(values)
+    settings.church_priority = next(values)
+    settings.mill_priority = next(values)
+    settings.navy_priority = next(values)
+    settings.university_priority = next(values)
+
+    # Read science priorities
+    settings.science_priorities = tuple(next(values) for _ in range(6))
+
+    return settings
 
 class AI:
     def __init__(
@@ -52,87 +129,112 @@ class AI:
         self.player_manager = player_manager
         self.terrain_manager = terrain_manager
         self.military_manager = military_manager
-        self.settings: Dict[str, AISettings] = {}
-        self.load_ai_settings()
-    
-    def load_ai_settings(self):
-        """Load AI settings from .ai files"""
-        try:
-            # Load default AI first
-            self.load_ai_file("default.ai")
-            
-            # Load other AI files
-            self.load_ai_file("land.ai")
-            self.load_ai_file("seatrade.ai")
-            
-        except Exception as e:
-            print(f"Error loading AI settings: {e}")
-            # Use default settings if loading fails
-            self.settings["default.ai"] = AISettings()
-    
-    def load_ai_file(self, filename: str):
-        """Load a single AI settings file"""
+        # Personality files parse lazily on first use; only the
+        # default fallback is loaded eagerly
+        self.settings: Dict[str, AISettings] = AISettingsCache()
+        _ = self.settings["default.ai"]
+        self._tick_cache: Optional[Dict] = None
+        self._rand_pool = iter(())
+
+    def _rand(self) -> float:
+        """Next uniform draw from a batch-generated pool
+
+        Refilling 4096 draws at a time from NumPy is much cheaper than
+        one random.random() call per use in the per-opponent hot path.
+        """
         try:
-            settings = AISettings()
-            
-            with open(filename, "r") as f:
-                # Read basic weights
-                settings.food_weight = float(f.readline())
-                settings.production_weight = float(f.readline())
-                settings.hate_weight = float(f.readline())
-                settings.diplomacy_weight = float(f.readline())
-                settings.friendliness = float(f.readline())
-                settings.chance = float(f.readline())
-                settings.trust_weight = float(f.readline())
-                settings.remote_weight = float(f.readline())
-                settings.min_trust = float(f.readline())
-                
-                # Read diplomatic thresholds
-                settings.trade_threshold = float(f.readline())
-                settings.friend_threshold = float(f.readline())
-                settings.ally_threshold = float(f.readline())
-                
-                # Read other settings
-                settings.min_morale = float(f.readline())
-                settings.min_tax = float(f.readline())
-                
-                # Read fear diplomacy levels
-                _ = [float(f.readline()) for _ in range(5)]  # fear_dipl values
-                
-                # Read military and building settings
-                settings.war_military_spending = float(f.readline())
-                settings.peace_military_spending = float(f.readline())
-                settings.building_chance = float(f.readline())
-                settings.church_priority = float(f.readline())
-                settings.mill_priority = float(f.readline())
-                settings.navy_priority = float(f.readline())
-                settings.university_priority = float(f.readline())
-                
-                # Read science priorities
-                settings.science_priorities = [float(f.readline()) for _ in range(6)]
-            
-            self.settings[filename] = settings
-            
-        except Exception as e:
-            print(f"Error loading {filename}: {e}")
-            self.settings[filename] = AISettings()
+            return next(self._rand_pool)
+        except StopIteration:
+            self._rand_pool = iter(np.random.random(4096).tolist())
+            return next(self._rand_pool)
     
+    @staticmethod
+    def _adjacent_mask(mask: np.ndarray) -> np.ndarray:
+        """Mark cells with at least one 4-neighbor set in mask
+
+        Works on a single (H, W) grid or a stacked (N, H, W) batch;
+        shifts always run over the last two axes.
+        """
+        adjacent = np.zeros_like(mask)
+        adjacent[..., 1:, :] |= mask[..., :-1, :]
+        adjacent[..., :-1, :] |= mask[..., 1:, :]
+        adjacent[..., :, 1:] |= mask[..., :, :-1]
+        adjacent[..., :, :-1] |= mask[..., :, 1:]
+        return adjacent
+
+    def begin_tick(self, game_map: Dict[str, List[List[int]]]):
+        """Precompute the per-player tile sets for every AI turn this tick
+
+        The owner layer does not change while the AI players take their
+        turns, so the owned/threatened/coast facts for all players can
+        be computed in one batched pass and sliced per player instead of
+        re-derived inside each make_decisions call.
+        """
+        owner = np.asarray(game_map["owner"])
+        terrain = np.asarray(game_map["terrain"])
+        ids = np.arange(self.player_manager.max_players + 1)
+
+        owned_stack = owner[None, :, :] == ids[:, None, None]  # (N+1, H, W)
+        enemy_stack = (owner != 0)[None, :, :] & ~owned_stack
+        threatened_stack = owned_stack & self._adjacent_mask(enemy_stack)
+        sea_adjacent = self._adjacent_mask(terrain == 0)
+
+        # Count shared borders between every pair of owners, so "does
+        # player i touch player j" is a matrix lookup for the whole tick
+        n = len(ids)
+        border_counts = np.zeros((n, n), dtype=np.int32)
+        owner_idx = owner.astype(np.intp)
+        for a, b in (
+            (owner_idx[:-1, :].ravel(), owner_idx[1:, :].ravel()),
+            (owner_idx[:, :-1].ravel(), owner_idx[:, 1:].ravel()),
+        ):
+            np.add.at(border_counts, (a, b), 1)
+            np.add.at(border_counts, (b, a), 1)
+
+        self._tick_cache = {
+            "owner": game_map["owner"],
+            "owned_coords": [np.argwhere(m) for m in owned_stack],
+            "threatened_coords": [np.argwhere(m) for m in threatened_stack],
+            "has_coast": (owned_stack & sea_adjacent[None, :, :]).any(axis=(1, 2)),
+            "border_counts": border_counts,
+        }
+
     def make_decisions(self, player: Player, game_map: Dict[str, List[List[int]]]):
         """Make all decisions for an AI-controlled player's turn"""
-        settings = self.settings.get(player.control, self.settings["default.ai"])
-        
+        settings = self.settings[player.control]
+
+        cache = self._tick_cache
+        if cache is not None and cache["owner"] is game_map["owner"]:
+            # Tile sets were batched for all players at tick start
+            owned_territories = cache["owned_coords"][player.id]
+            threatened_territories = cache["threatened_coords"][player.id]
+            has_coast = bool(cache["has_coast"][player.id])
+        else:
+            # No tick preamble ran; scan the grid once for this player
+            owner = np.asarray(game_map["owner"])
+            terrain = np.asarray(game_map["terrain"])
+            owned_mask = owner == player.id
+            enemy_mask = (owner != 0) & ~owned_mask
+            owned_territories = np.argwhere(owned_mask)
+            threatened_territories = np.argwhere(
+                owned_mask & self._adjacent_mask(enemy_mask)
+            )
+            has_coast = bool((owned_mask & self._adjacent_mask(terrain == 0)).any())
+
         # Adjust tax rate
         self._adjust_tax_rate(player, settings)
-        
+
         # Make diplomatic decisions
         self._make_diplomatic_decisions(player, settings, game_map)
-        
+
         # Make military decisions
-        self._make_military_decisions(player, settings, game_map)
-        
+        self._make_military_decisions(
+            player, settings, game_map, threatened_territories, has_coast
+        )
+
         # Handle construction
-        if player.money > 0 and random.random() < settings.building_chance:
-            self._handle_construction(player, settings, game_map)
+        if player.money > 0 and self._rand() < settings.building_chance:
+            self._handle_construction(player, settings, game_map, owned_territories)
     
     def _adjust_tax_rate(self, player: Player, settings: AISettings):
         """Adjust player's tax rate based on morale and unemployment"""
@@ -142,26 +244,68 @@ class AI:
             1 - player.unemployed / max(player.population, 1)
         )
         
-        # Try different tax rates
-        best_tax = settings.min_tax
-        for tax in range(1, 26):  # 0.01 to 0.25
+        # Morale only falls as tax rises, so the highest acceptable rate
+        # in 0.01-0.25 can be found by bisection instead of trying all 25
+        def morale_at(tax: int) -> float:
             player.tax_rate = tax / 100
             self.player_manager.calculate_morale(player)
-            if player.morale > min_morale:
-                best_tax = tax / 100
-        
+            return player.morale
+
+        if morale_at(1) > min_morale:
+            lo, hi = 1, 25
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if morale_at(mid) > min_morale:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            best_tax = lo / 100
+        else:
+            best_tax = settings.min_tax
+
         player.tax_rate = max(best_tax, settings.min_tax)
         self.player_manager.calculate_morale(player)
     
     def _make_diplomatic_decisions(self, player: Player, settings: AISettings, game_map: Dict[str, List[List[int]]]):
         """Handle diplomatic relations and actions"""
+        # Tally every player's army in a single bincount pass so each
+        # opponent comparison below is an array lookup instead of a scan
+        owner = np.asarray(game_map["owner"])
+        army = np.asarray(game_map["army"])
+        army_totals = np.bincount(
+            owner.ravel(),
+            weights=army.ravel(),
+            minlength=self.player_manager.max_players + 1
+        ).astype(np.int64)
+
+        # These only depend on the acting player, not the opponent;
+        # keep reciprocals so the per-opponent math is multiply-only
+        inv_player_fleet = 1.0 / max(int(army_totals[player.id]) + player.navy, 1)
+        inv_player_military = 1.0 / max(player.science.military, 1)
+
+        cache = self._tick_cache
+        border_counts = (
+            cache["border_counts"]
+            if cache is not None and cache["owner"] is game_map["owner"]
+            else None
+        )
+
         for other_id, other_player in self.player_manager.players.items():
             if other_id == player.id or other_player.land_count == 0:
                 continue
-            
+
+            # Players with no shared border and no fleets cannot
+            # interact this turn; treat them as neutral without scoring
+            if (border_counts is not None
+                    and border_counts[player.id, other_id] == 0
+                    and player.navy == 0 and other_player.navy == 0):
+                player.diplomatic_actions[other_id] = 0
+                continue
+
             # Calculate diplomatic value
             value = self._calculate_diplomatic_value(
-                player, other_player, settings, game_map
+                player, other_player, settings, army_totals,
+                inv_player_fleet, inv_player_military
             )
             
             # Decide action based on value
@@ -177,36 +321,31 @@ class AI:
         player: Player,
         other: Player,
         settings: AISettings,
-        game_map: Dict[str, List[List[int]]]
+        army_totals: np.ndarray,
+        inv_player_fleet: float,
+        inv_player_military: float
     ) -> float:
         """Calculate diplomatic value of relationship with another player"""
-        
+
         # Base value from relative strength
         relative_strength = other.land_count / max(player.land_count, 1)
         value = 1 - relative_strength
-        
+
         # Modify based on trust
         value *= (1 + (other.trust - 1) * settings.trust_weight)
-        
-        # Calculate total army units for each player
-        player_army = 0
-        other_army = 0
-        for y in range(15):
-            for x in range(15):
-                if game_map["owner"][y][x] == player.id:
-                    player_army += game_map["army"][y][x]
-                elif game_map["owner"][y][x] == other.id:
-                    other_army += game_map["army"][y][x]
-        
+
+        # Look up the opponent's total army units
+        other_army = int(army_totals[other.id])
+
         # Consider military threat including science advantage
         military_threat = (
-            (other_army + other.navy) / max(player_army + player.navy, 1) * 
-            other.science.military / max(player.science.military, 1)
+            (other_army + other.navy) * inv_player_fleet *
+            other.science.military * inv_player_military
         )
         value -= military_threat * settings.hate_weight
         
         # Apply random variation
-        value *= (1 - settings.chance + random.random() * 2 * settings.chance)
+        value *= (1 - settings.chance + self._rand() * 2 * settings.chance)
         
         return value
     
@@ -214,126 +353,104 @@ class AI:
         self,
         player: Player,
         settings: AISettings,
-        game_map: Dict[str, List[List[int]]]
+        game_map: Dict[str, List[List[int]]],
+        threatened_territories: np.ndarray,
+        has_coast: bool
     ):
         """Make decisions about military spending and actions"""
         # Determine military spending ratio based on threats
-        at_war = any(rel == 1 for rel in player.diplomatic_relations.values())
+        at_war = player.diplomatic_relations.war_count > 0
         military_ratio = (
-            settings.war_military_spending if at_war 
+            settings.war_military_spending if at_war
             else settings.peace_military_spending
         )
-        
+
         # Calculate military budget
         military_budget = int(player.money * military_ratio)
-        
+
         if military_budget > 0:
             # Prioritize defense of threatened territories
-            self._defend_territories(player, military_budget, game_map)
-            
+            self._defend_territories(
+                player, military_budget, game_map, threatened_territories
+            )
+
             # Build navy if coastal
-            if self._has_coast(player, game_map):
+            if has_coast:
                 navy_budget = int(military_budget * settings.navy_priority)
                 self._build_navy(player, navy_budget, game_map)
-    
+
     def _defend_territories(
         self,
         player: Player,
         budget: int,
-        game_map: Dict[str, List[List[int]]]
+        game_map: Dict[str, List[List[int]]],
+        threatened_territories: np.ndarray
     ):
         """Defend territories based on threat levels"""
-        # Find territories that need defense
-        threatened_territories = []
-        for y in range(len(game_map["terrain"])):
-            for x in range(len(game_map["terrain"][0])):
-                if game_map["owner"][y][x] == player.id:
-                    # Check adjacent tiles for enemies
-                    for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
-                        nx, ny = x + dx, y + dy
-                        if (0 <= nx < len(game_map["terrain"][0]) and 
-                            0 <= ny < len(game_map["terrain"]) and
-                            game_map["owner"][ny][nx] != player.id and
-                            game_map["owner"][ny][nx] != 0):  # Not empty
-                            threatened_territories.append((x, y))
-                            break
-        
         # Build armies in threatened territories
-        if threatened_territories:
+        if len(threatened_territories):
             army_cost = self.military_manager.ARMY_COST
             armies_per_territory = max(1, budget // (len(threatened_territories) * army_cost))
-            
-            for x, y in threatened_territories:
-                if player.money >= army_cost:
-                    game_map["army"][y][x] += armies_per_territory
-                    player.money -= armies_per_territory * army_cost
-    
-    def _has_coast(self, player: Player, game_map: Dict[str, List[List[int]]]) -> bool:
-        """Check if player has coastal territories"""
-        for y in range(len(game_map["terrain"])):
-            for x in range(len(game_map["terrain"][0])):
-                if game_map["owner"][y][x] == player.id:
-                    # Check adjacent tiles for sea
-                    for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
-                        new_x, new_y = x + dx, y + dy
-                        if (0 <= new_x < len(game_map["terrain"][0]) and 
-                            0 <= new_y < len(game_map["terrain"]) and
-                            game_map["terrain"][new_y][new_x] == 0):
-                            return True
-        return False
+
+            # Fund as many territories as the treasury allows, then
+            # place all the armies in one scatter update
+            cost_per_territory = armies_per_territory * army_cost
+            if player.money >= army_cost:
+                funded = min(
+                    len(threatened_territories),
+                    (player.money - army_cost) // cost_per_territory + 1
+                )
+            else:
+                funded = 0
+
+            if funded:
+                ys = threatened_territories[:funded, 0]
+                xs = threatened_territories[:funded, 1]
+                game_map["army"][ys, xs] += armies_per_territory
+                player.money -= funded * cost_per_territory
     
     def _build_navy(self, player: Player, budget: int, game_map: Dict[str, List[List[int]]]):
         """Build navy units based on needs"""
         if budget <= 0:
             return
-            
-        # Check if we have any armies waiting to embark
-        armies_to_embark = 0
-        for y in range(15):
-            for x in range(15):
-                if game_map["owner"][y][x] == player.id and game_map["army"][y][x] > 0:
-                    # Check adjacent tiles for sea
-                    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                        new_x, new_y = x + dx, y + dy
-                        if (0 <= new_x < 15 and 0 <= new_y < 15 and 
-                            game_map["terrain"][new_y][new_x] == 0):  # Sea is terrain type 0
-                            armies_to_embark += game_map["army"][y][x]
-                            break
-        
+
+        owner = np.asarray(game_map["owner"])
+        terrain = np.asarray(game_map["terrain"])
+        army = np.asarray(game_map["army"])
+        owned_mask = owner == player.id
+        sea_mask = terrain == 0  # Sea is terrain type 0
+
+        # Count armies on owned tiles bordering sea, waiting to embark
+        embark_mask = owned_mask & self._adjacent_mask(sea_mask)
+        armies_to_embark = int(army[embark_mask].sum())
+
         # Build enough ships to transport armies
         ships_needed = (armies_to_embark + 9) // 10  # Each ship can carry 10 armies
         ships_possible = budget // self.military_manager.NAVY_COST
         ships_to_build = min(ships_needed, ships_possible)
-        
-        # Find coastal territories to build navy in
-        for y in range(15):
-            for x in range(15):
-                if (game_map["owner"][y][x] == player.id and 
-                    game_map["terrain"][y][x] == 0 and  # Sea tile
-                    ships_to_build > 0):
-                    game_map["army"][y][x] += 1  # Navy units are stored in army layer
-                    ships_to_build -= 1
-                    player.money -= self.military_manager.NAVY_COST
+        if ships_to_build <= 0:
+            return
+
+        # Build navy in owned sea territories, one ship per tile
+        build_sites = np.argwhere(owned_mask & sea_mask)[:ships_to_build]
+        if len(build_sites):
+            # Navy units are stored in army layer
+            game_map["army"][build_sites[:, 0], build_sites[:, 1]] += 1
+            player.money -= len(build_sites) * self.military_manager.NAVY_COST
     
     def _handle_construction(
         self,
         player: Player,
         settings: AISettings,
-        game_map: Dict[str, List[List[int]]]
+        game_map: Dict[str, List[List[int]]],
+        owned_territories: np.ndarray
     ):
         """Handle construction of buildings"""
-        # Find territories owned by the player
-        owned_territories = []
-        for y in range(len(game_map["terrain"])):
-            for x in range(len(game_map["terrain"][0])):
-                if game_map["owner"][y][x] == player.id:
-                    owned_territories.append((x, y))
-        
-        if not owned_territories:
+        if not len(owned_territories):
             return
-            
+
         # Choose a random territory to build in
-        x, y = random.choice(owned_territories)
+        y, x = owned_territories[random.randrange(len(owned_territories))]
         
         # Decide what to build based on priorities
         choices = [
@@ -342,25 +459,19 @@ class AI:
             (settings.university_priority, "university", self.military_manager.UNIVERSITY_COST)
         ]
         
-        # Filter out choices we can't afford
-        affordable = [(p, b, c) for p, b, c in choices if player.money >= c]
+        # Filter out choices we can't afford or with no priority
+        affordable = [(p, b, c) for p, b, c in choices if player.money >= c and p > 0]
         if not affordable:
             return
-            
-        # Weight choices by priority
-        total = sum(p for p, _, _ in affordable)
-        if total <= 0:
-            return
-            
-        r = random.random() * total
-        current = 0
-        for priority, building, cost in affordable:
-            current += priority
-            if r <= current:
-                # Build it
-                game_map[building][y][x] += 1
-                player.money -= cost
-                break
+
+        # Pick one choice weighted by priority
+        _, building, cost = random.choices(
+            affordable, weights=[p for p, _, _ in affordable]
+        )[0]
+
+        # Build it
+        game_map[building][y, x] += 1
+        player.money -= cost
     
     def _handle_science_development(self, player: Player, settings: AISettings):
         """Science development is automatic through universities"""
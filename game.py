@@ -1,5 +1,9 @@
+import io
+import json
 import os
+import re
 import sys
+import numpy as np
 import pygame
 from typing import Dict, List, Optional
 from player import Player, PlayerManager
@@ -10,167 +14,372 @@ from military import MilitaryManager
 from ai import AI
 from interface import Interface
 
+# Science branch display names indexed by branch - 1
+BRANCH_NAMES = ("Agriculture", "Industry", "Trade",
+                "Sailing", "Military", "Medicine")
+
+# Commands with numeric suffixes (spend_science_3_1000, set_negative_2,
+# improve_relations_4) are parsed with one compiled regex instead of a
+# split() per UI event
+_NUMERIC_CMD_RE = re.compile(
+    r'^(spend_science|set_negative|improve_relations)_(\d+)(?:_(\d+))?$'
+)
+
 class Game:
+    # Square map edge length; bounds checks index off this instead of
+    # hardcoded literals
+    MAP_SIZE = 15
+
+    # Map layer order inside the SoA tensor
+    LAYERS = ("owner", "original", "terrain", "fort", "church",
+              "university", "mill", "army", "moved")
+
+    # 4-neighbor offsets in left/right/up/down scan order
+    _NEIGH_DX = np.array([-1, 1, 0, 0])
+    _NEIGH_DY = np.array([0, 0, -1, 1])
+
+    # Military unit batch sizes selected by state.code
+    _UNIT_SIZES = (1, 2, 5, 10, 20, 50, 100)
+
     def __init__(self):
+        # Let SDL coalesce consecutive draw calls into one GPU
+        # submission (SDL 2.0.10+); harmless on older backends
+        os.environ.setdefault("SDL_RENDER_BATCHING", "1")
         pygame.init()
-        
+
         # Initialize managers
         self.terrain_manager = TerrainManager()
         self.player_manager = PlayerManager()
         self.military_manager = MilitaryManager(self.terrain_manager)
         self.ai = AI(self.player_manager, self.terrain_manager, self.military_manager)
         self.interface = Interface()
+        # The players dict reference never changes at runtime, so the
+        # interface is wired up once here
+        self.interface.all_players = self.player_manager.players
         
         # Game state
         self.running = True
         self.turn = 0
-        self.game_map = {
-            "owner": [[0] * 15 for _ in range(15)],
-            "original": [[0] * 15 for _ in range(15)],
-            "terrain": [[0] * 15 for _ in range(15)],
-            "fort": [[0] * 15 for _ in range(15)],
-            "church": [[0] * 15 for _ in range(15)],
-            "university": [[0] * 15 for _ in range(15)],
-            "mill": [[0] * 15 for _ in range(15)],
-            "army": [[0] * 15 for _ in range(15)],
-            "moved": [[0] * 15 for _ in range(15)]
-        }
+        # Structure-of-arrays map storage: all nine layers live in one
+        # contiguous (layer, y, x) tensor; the named attributes and the
+        # game_map dict are zero-copy views into it
+        # Terrain attribute lookup tables indexed by terrain id, so the
+        # per-turn scans index arrays instead of walking dataclasses
+        self._food_lut = self.terrain_manager.food_potentials
+        self._prod_lut = self.terrain_manager.production_potentials
+        self._defense_lut = self.terrain_manager.defense_bonuses
+        self._terrain_names = tuple(
+            t.name for t in self.terrain_manager.terrain_types
+        )
+
+        # Draw-call palettes, invariant after init
+        self._owner_colors = (0, 2, 4, 1, 14, 8, 15, 11, 13, 12)
+        self._terrain_colors = tuple(
+            t.color for t in self.terrain_manager.terrain_types
+        )
+
+        # int64 cells: army counts are unbounded in gameplay (money
+        # compounds, so AI armies can reach the tens of thousands per
+        # tile), and the whole tensor is only a few kilobytes anyway
+        self._map = np.zeros(
+            (len(self.LAYERS), self.MAP_SIZE, self.MAP_SIZE), dtype=np.int64
+        )
+        self.game_map = dict(zip(self.LAYERS, self._map))
+        (self.owner, self.original, self.terrain, self.fort, self.church,
+         self.university, self.mill, self.army, self.moved) = (
+            self.game_map[layer] for layer in self.LAYERS
+        )
+
+        self._build_command_tables()
+
+        # Territory-composition stats are cached per player until the
+        # ownership layer actually changes
+        self._owner_version = 0
+        self._terrain_stats_cache = {}
+
+        # Current-player reference cached per id so the frame loop does
+        # not re-resolve it on every iteration
+        self._current_player_cache = (None, -1)
+
+        # Frame pacing for the main loop; the game is turn-based so
+        # 30 FPS is plenty
+        self.clock = pygame.time.Clock()
+
+    def _cached_current_player(self) -> Optional[Player]:
+        """Resolve the current player, re-fetching only on id change"""
+        pid = self.player_manager.current_player_id
+        if self._current_player_cache[1] != pid:
+            self._current_player_cache = (
+                self.player_manager.get_player(pid), pid
+            )
+        return self._current_player_cache[0]
+
+    def _mark_owner_changed(self):
+        """Invalidate caches keyed on the ownership layer"""
+        self._owner_version += 1
+        self._terrain_stats_cache.clear()
+
+    def _player_terrain_stats(self, player_id: int):
+        """Food and territory-composition stats for a player's tiles
+
+        Returns (total_food, territory_count, land_tiles, sea_tiles,
+        total_production, trade_routes), cached until ownership changes.
+        """
+        key = (player_id, self._owner_version)
+        stats = self._terrain_stats_cache.get(key)
+        if stats is None:
+            own = self.owner == player_id
+            territory_count = int(own.sum())
+            total_food = float(self._food_lut[self.terrain][own].sum())
+            sea_tiles = int((own & (self.terrain == 0)).sum())
+            land_tiles = territory_count - sea_tiles
+            total_production = int((own & (self._prod_lut[self.terrain] > 0)).sum())
+            # Owned tiles with at least one adjacent owned tile count as
+            # trade routes
+            trade_routes = int((own & self.ai._adjacent_mask(own)).sum())
+            stats = (total_food, territory_count, land_tiles, sea_tiles,
+                     total_production, trade_routes)
+            self._terrain_stats_cache[key] = stats
+        return stats
         
     def load_scenario(self, filename: str) -> bool:
-        """Load a scenario file"""
+        """Load a scenario file
+
+        Text .scn files are parsed line by line; .sav files use the
+        compressed binary layout written by save_game.
+        """
+        if filename.endswith(".sav"):
+            return self._load_binary(filename)
         try:
+            # Slurp the whole file once and walk a line iterator instead
+            # of issuing a readline call per field
             with open(filename, 'r') as f:
-                # Read scenario data
-                num_players = int(f.readline())
-                current_player = int(f.readline())
-                self.turn = int(f.readline())
-                
-                # Skip science money
-                for _ in range(6):
-                    _ = int(f.readline())
-                
-                # Read player data
-                for i in range(1, num_players + 1):
-                    name = f.readline().strip()
-                    control = f.readline().strip()
-                    player = self.player_manager.add_player(i, name, control)
-                    
-                    player.population = int(f.readline())
-                    player.distribute_population()
-                    player.money = int(f.readline())
-                    player.navy = int(f.readline())
-                    player.sea_army = int(f.readline())
-                    player.sea_moved = int(f.readline())
-                    player.tax_rate = float(f.readline())
-                    player.trust = float(f.readline())
-                    
-                    # Read science levels
-                    for j in range(1, 7):
-                        player.science.set_level(j, float(f.readline()))
-                    
-                    # Skip diplomatic data for now
-                    for _ in range(num_players * 2):
-                        _ = f.readline()
-                
-                # Read map data
-                map_data = ["owner", "original", "terrain", "fort", "church", 
-                           "university", "mill", "army", "moved"]
-                
-                for data_type in map_data:
-                    for i in range(15):
-                        # Handle comma-separated values
-                        row = list(map(int, f.readline().strip().replace(' ', '').split(',')))
-                        for j in range(15):
-                            self.game_map[data_type][i][j] = row[j]
-                            
-                            # Update player land count when processing owner data
-                            if data_type == "owner" and row[j] != 0:
-                                player = self.player_manager.get_player(row[j])
-                                if player:
-                                    player.land_count += 1
-                            
+                lines = iter(f.read().splitlines())
+
+            # Read scenario data
+            num_players = int(next(lines))
+            current_player = int(next(lines))
+            self.turn = int(next(lines))
+
+            # Skip science money
+            for _ in range(6):
+                _ = int(next(lines))
+
+            # Read player data
+            for i in range(1, num_players + 1):
+                name = next(lines).strip()
+                control = next(lines).strip()
+                player = self.player_manager.add_player(i, name, control)
+
+                player.population = int(next(lines))
+                player.distribute_population()
+                player.money = int(next(lines))
+                player.navy = int(next(lines))
+                player.sea_army = int(next(lines))
+                player.sea_moved = int(next(lines))
+                player.tax_rate = float(next(lines))
+                player.trust = float(next(lines))
+
+                # Read science levels
+                for j in range(1, 7):
+                    player.science.set_level(j, float(next(lines)))
+
+                # Skip diplomatic data for now
+                for _ in range(num_players * 2):
+                    _ = next(lines)
+
+            # Read map data
+            map_data = ["owner", "original", "terrain", "fort", "church",
+                       "university", "mill", "army", "moved"]
+
+            for data_type in map_data:
+                # Parse each comma-separated 15-row block in C
+                self.game_map[data_type][:] = np.loadtxt(
+                    lines, delimiter=',', max_rows=self.MAP_SIZE,
+                    dtype=np.int64
+                )
+
+            # Credit owned tiles to each player's land count
+            ids, tile_counts = np.unique(
+                self.owner[self.owner != 0], return_counts=True
+            )
+            for owner_id, count in zip(ids, tile_counts):
+                player = self.player_manager.get_player(int(owner_id))
+                if player:
+                    player.land_count += int(count)
+
+            self._mark_owner_changed()
+
             return True
             
         except Exception as e:
             print(f"Error loading scenario: {e}")
             return False
     
+    def _load_binary(self, filename: str) -> bool:
+        """Load a .sav file: map tensor plus a JSON metadata blob"""
+        try:
+            with np.load(filename) as data:
+                meta = json.loads(str(data["meta"]))
+                self.turn = meta["turn"]
+                self.player_manager.current_player_id = meta["current_player"]
+
+                for entry in meta["players"]:
+                    player = self.player_manager.add_player(
+                        entry["id"], entry["name"], entry["control"]
+                    )
+                    player.population = entry["population"]
+                    player.distribute_population()
+                    player.money = entry["money"]
+                    player.navy = entry["navy"]
+                    player.sea_army = entry["sea_army"]
+                    player.sea_moved = entry["sea_moved"]
+                    player.tax_rate = entry["tax_rate"]
+                    player.trust = entry["trust"]
+                    for j, level in enumerate(entry["science"], start=1):
+                        player.science.set_level(j, level)
+
+                # All nine layers arrive as one array copy
+                self._map[:] = data["map"]
+
+            # Credit owned tiles to each player's land count
+            ids, tile_counts = np.unique(
+                self.owner[self.owner != 0], return_counts=True
+            )
+            for owner_id, count in zip(ids, tile_counts):
+                player = self.player_manager.get_player(int(owner_id))
+                if player:
+                    player.land_count += int(count)
+
+            self._mark_owner_changed()
+            return True
+
+        except Exception as e:
+            print(f"Error loading scenario: {e}")
+            return False
+
     def save_game(self, filename: str) -> bool:
-        """Save the current game state"""
+        """Save the current game state
+
+        Writes the line-oriented text format for .scn compatibility; a
+        .sav filename gets the compressed binary layout instead, which
+        stores the whole map tensor in one shot.
+        """
+        if filename.endswith(".sav"):
+            return self._save_binary(filename)
         try:
-            with open(filename, 'w') as f:
-                # Write basic game data
-                f.write(f"{len(self.player_manager.players)}\n")
-                f.write(f"{self.player_manager.current_player_id}\n")
-                f.write(f"{self.turn}\n")
-                
-                # Write placeholder science money
-                for _ in range(6):
-                    f.write("0\n")
+            # Accumulate the whole text image in memory and flush it with
+            # a single write
+            f = io.StringIO()
+            # Write basic game data
+            f.write(f"{len(self.player_manager.players)}\n")
+            f.write(f"{self.player_manager.current_player_id}\n")
+            f.write(f"{self.turn}\n")
+            
+            # Write placeholder science money
+            for _ in range(6):
+                f.write("0\n")
+            
+            # Write player data
+            for player in self.player_manager.players.values():
+                f.write(f"{player.name}\n")
+                f.write(f"{player.control}\n")
+                f.write(f"{player.population}\n")
+                f.write(f"{player.money}\n")
+                f.write(f"{player.navy}\n")
+                f.write(f"{player.sea_army}\n")
+                f.write(f"{player.sea_moved}\n")
+                f.write(f"{player.tax_rate}\n")
+                f.write(f"{player.trust}\n")
                 
-                # Write player data
-                for player in self.player_manager.players.values():
-                    f.write(f"{player.name}\n")
-                    f.write(f"{player.control}\n")
-                    f.write(f"{player.population}\n")
-                    f.write(f"{player.money}\n")
-                    f.write(f"{player.navy}\n")
-                    f.write(f"{player.sea_army}\n")
-                    f.write(f"{player.sea_moved}\n")
-                    f.write(f"{player.tax_rate}\n")
-                    f.write(f"{player.trust}\n")
-                    
-                    # Write science levels
-                    for i in range(1, 7):
-                        f.write(f"{player.science.get_level(i)}\n")
-                    
-                    # Write diplomatic data
-                    for i in range(len(self.player_manager.players)):
-                        f.write("2\n")  # Placeholder diplomatic relations
-                    for i in range(len(self.player_manager.players)):
-                        f.write("0\n")  # Placeholder diplomatic actions
+                # Write science levels
+                for i in range(1, 7):
+                    f.write(f"{player.science.get_level(i)}\n")
                 
-                # Write map data
-                for data_type in ["owner", "original", "terrain", "fort", "church",
-                                "university", "mill", "army", "moved"]:
-                    for row in self.game_map[data_type]:
-                        f.write(", ".join(map(str, row)) + "\n")
-                        
+                # Write diplomatic data
+                for i in range(len(self.player_manager.players)):
+                    f.write("2\n")  # Placeholder diplomatic relations
+                for i in range(len(self.player_manager.players)):
+                    f.write("0\n")  # Placeholder diplomatic actions
+            
+            # Write map data, one formatted block per layer
+            for data_type in ["owner", "original", "terrain", "fort", "church",
+                            "university", "mill", "army", "moved"]:
+                np.savetxt(f, self.game_map[data_type], fmt="%d", delimiter=", ")
+
+            with open(filename, 'w') as out:
+                out.write(f.getvalue())
+
             return True
             
         except Exception as e:
             print(f"Error saving game: {e}")
             return False
-    
+
+    def _save_binary(self, filename: str) -> bool:
+        """Save a .sav file: map tensor plus a JSON metadata blob"""
+        try:
+            meta = {
+                "turn": self.turn,
+                "current_player": self.player_manager.current_player_id,
+                "players": [
+                    {
+                        "id": player.id,
+                        "name": player.name,
+                        "control": player.control,
+                        "population": player.population,
+                        "money": player.money,
+                        "navy": player.navy,
+                        "sea_army": player.sea_army,
+                        "sea_moved": player.sea_moved,
+                        "tax_rate": player.tax_rate,
+                        "trust": player.trust,
+                        "science": [player.science.get_level(i)
+                                    for i in range(1, 7)],
+                    }
+                    for player in self.player_manager.players.values()
+                ],
+            }
+            # Pass a file object so numpy keeps the .sav name as-is
+            with open(filename, 'wb') as f:
+                np.savez_compressed(
+                    f, map=self._map, meta=np.array(json.dumps(meta))
+                )
+            return True
+
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return False
+
     def get_territory_info(self, x: int, y: int) -> Dict:
         """Get information about the selected territory"""
         info = {}
         
         # Get owner
-        owner_id = self.game_map["owner"][y][x]
+        players = self.player_manager.players
+        owner_id = self.owner[y, x]
         if owner_id != 0:
-            owner = self.player_manager.get_player(owner_id)
+            owner = players.get(owner_id)
             info["Owner"] = owner.name if owner else "Unknown"
-            
+
             # Get original owner
-            original_id = self.game_map["original"][y][x]
-            original = self.player_manager.get_player(original_id)
+            original_id = self.original[y, x]
+            original = players.get(original_id)
             info["Original Owner"] = original.name if original else "Unknown"
         
-        # Get terrain info
-        terrain_id = self.game_map["terrain"][y][x]
-        terrain = self.terrain_manager.get_terrain(terrain_id)
-        info["Terrain"] = terrain.name
-        info["Food"] = f"{terrain.food_potential:.1f}"
-        info["Resources"] = f"{terrain.production_potential:.1f}"
-        info["Defense"] = f"{terrain.defense_bonus * 100:.0f}%"
+        # Get terrain info from the lookup tables
+        terrain_id = self.terrain[y, x]
+        info["Terrain"] = self._terrain_names[terrain_id]
+        info["Food"] = f"{self._food_lut[terrain_id]:.1f}"
+        info["Resources"] = f"{self._prod_lut[terrain_id]:.1f}"
+        info["Defense"] = f"{self._defense_lut[terrain_id] * 100:.0f}%"
         
         # Get building info
-        info["Forts"] = self.game_map["fort"][y][x]
-        info["Churches"] = self.game_map["church"][y][x]
-        info["Universities"] = self.game_map["university"][y][x]
-        info["Mills"] = self.game_map["mill"][y][x]
-        info["Army"] = self.game_map["army"][y][x]
+        info["Forts"] = self.fort[y, x]
+        info["Churches"] = self.church[y, x]
+        info["Universities"] = self.university[y, x]
+        info["Mills"] = self.mill[y, x]
+        info["Army"] = self.army[y, x]
         
         return info
     
@@ -185,149 +394,227 @@ class Game:
         except Exception as e:
             self.interface.state.message = f"Could not load help file: {e}"
 
+    def _build_command_tables(self):
+        """Wire command names and prefixes to their handler methods"""
+        self._cmd_table = {
+            "spy": self._cmd_spy,
+            "info": self._cmd_info,
+            "treasury": self._cmd_treasury,
+            "decrease_tax": self._cmd_decrease_tax,
+            "increase_tax": self._cmd_increase_tax,
+            "science": self._cmd_science,
+            "diplomacy": self._cmd_diplomacy,
+            "help": self._cmd_help,
+            "end_turn": self._cmd_end_turn,
+            "E": self._cmd_end_turn,
+            "save_game": self._cmd_save_game,
+            "quit": self._cmd_quit,
+            "embark": self._cmd_embark,
+        }
+        self._prefix_table = {
+            "build_": self._handle_build_command,
+            "sell_": self._handle_sell_command,
+            "move_": self._handle_move_command,
+        }
+        self._numeric_cmd_table = {
+            "spend_science": self._cmd_spend_science,
+            "set_negative": self._cmd_set_negative,
+            "improve_relations": self._cmd_improve_relations,
+        }
+        # Static building rules: forbidden terrain names, cost resolved
+        # once, and the map layer the build bumps. Army and navy keep
+        # dedicated branches because they touch population and fleets.
+        self._build_dispatch = {
+            "army": self._build_army,
+            "navy": self._build_navy,
+        }
+        self._build_rules = {
+            "fort": (frozenset({"sea", "swamp"}),
+                     self.military_manager.FORT_COST, self.fort),
+            "church": (frozenset({"sea", "mountain"}),
+                       self.military_manager.CHURCH_COST, self.church),
+            "university": (frozenset({"sea", "mountain", "swamp", "desert"}),
+                           self.military_manager.UNIVERSITY_COST, self.university),
+            "mill": (frozenset({"sea", "desert", "tundra"}),
+                     self.military_manager.MILL_COST, self.mill),
+        }
+        # Simple sales mirror the build rules: refund resolved once,
+        # plus the layer to decrement
+        mm = self.military_manager
+        self._sell_rules = {
+            "fort": (int(mm.FORT_COST * mm.FORT_SELL), self.fort),
+            "church": (int(mm.CHURCH_COST * mm.CHURCH_SELL), self.church),
+            "university": (int(mm.UNIVERSITY_COST * mm.UNIVERSITY_SELL),
+                           self.university),
+            "mill": (int(mm.MILL_COST * mm.MILL_SELL), self.mill),
+        }
+
     def handle_command(self, command: Optional[str]):
         """Handle game commands"""
         if not command:
             return
-            
+
         current_player = self.player_manager.get_player(
             self.player_manager.current_player_id
         )
         if not current_player:
             return
-            
-        x = self.interface.state.selected_x
-        y = self.interface.state.selected_y
-        
+
+        state = self.interface.state
+        x = state.selected_x
+        y = state.selected_y
+
         # Split command into parts
         parts = command.split()
-        cmd = parts[0]
-        
-        if cmd == "spy":
-            if len(parts) == 2:
-                target_id = int(parts[1])
-                target = self.player_manager.get_player(target_id)
-                if target:
-                    spy_cost = current_player.get_spy_cost(target)
-                    if current_player.money >= spy_cost:
-                        current_player.money -= spy_cost
-                        current_player.science.spied_empires[target_id] = True
-                        self.interface.state.message = f"Spy placed in {target.name}"
-                    else:
-                        self.interface.state.message = "Not enough gold to place spy"
-        
-        # Handle game screen commands
-        elif cmd == "info":
-            self.interface.current_player = current_player
-            self.interface.state.active_screen = "info"
-        elif cmd == "treasury":
-            self.interface.current_player = current_player
-            self.interface.state.active_screen = "treasury"
-        elif cmd == "decrease_tax":
-            if current_player.tax_rate >= 10:
-                current_player.tax_rate = max(0, current_player.tax_rate - 10)
-                self.interface.state.message = f"Tax rate decreased to {current_player.tax_rate:.1f}%"
-                # Update treasury screen to show new projected income
-                if self.interface.state.active_screen == "treasury":
-                    self.interface.current_player = current_player
-        elif cmd == "increase_tax":
-            if current_player.tax_rate <= 90:
-                current_player.tax_rate = min(100, current_player.tax_rate + 10)
-                self.interface.state.message = f"Tax rate increased to {current_player.tax_rate:.1f}%"
-                # Update treasury screen to show new projected income
-                if self.interface.state.active_screen == "treasury":
-                    self.interface.current_player = current_player
-        elif cmd == "science":
-            self.interface.current_player = current_player
-            self.interface.state.active_screen = "science"
-        elif cmd == "diplomacy":
-            self.interface.current_player = current_player
-            self.interface.all_players = self.player_manager.players
-            self.interface.state.active_screen = "diplomacy"
-        elif cmd == "help":
-            self._display_help_file("how.hlp")
-        # Handle other commands
-        elif command == "end_turn" or command == "E":
-            self._handle_end_turn()
-        elif command == "save_game":
-            save_num = self.interface.state.save_number
-            filename = f"save{save_num}.scn"
-            if self.save_game(filename):
-                self.interface.state.message = f"Game saved as {filename}"
-                self.interface.state.save_number += 1
-        elif command == "quit":
-            self.running = False
-        elif command.startswith("build_"):
-            self._handle_build_command(command[6:], current_player, x, y)
-        elif command.startswith("sell_"):
-            self._handle_sell_command(command[5:], current_player, x, y)
-        elif command.startswith("move_"):
-            self._handle_move_command(command[5:], current_player, x, y)
-        elif command == "embark":
-            self._handle_embark_command(current_player, x, y)
-        elif command.startswith("spend_science_"):
-            # Parse branch and amount from command (format: spend_science_1_1000)
-            _, _, branch, amount = command.split("_")
-            branch = int(branch)
-            amount = int(amount)
-            
-            # Spend money on science
-            progress = self.player_manager.spend_on_science(current_player, branch, amount)
-            if progress > 0:
-                branch_names = {
-                    1: "Agriculture",
-                    2: "Industry", 
-                    3: "Trade",
-                    4: "Sailing",
-                    5: "Military",
-                    6: "Medicine"
-                }
-                self.interface.state.message = f"Advanced {branch_names[branch]} by {progress:.2f} levels"
-            else:
-                self.interface.state.message = "Could not advance science"
-                
-        elif command.startswith("set_negative_"):
-            target_id = int(command.split("_")[-1])
+
+        # Exact commands dispatch through the table; parameterized
+        # commands match on their prefix
+        handler = self._cmd_table.get(parts[0])
+        if handler:
+            handler(current_player, parts, x, y)
+            return
+
+        match = _NUMERIC_CMD_RE.match(command)
+        if match:
+            kind, first, second = match.groups()
+            self._numeric_cmd_table[kind](current_player, first, second, x, y)
+            return
+
+        for prefix, prefix_handler in self._prefix_table.items():
+            if command.startswith(prefix):
+                prefix_handler(command[len(prefix):], current_player, x, y)
+                return
+
+    def _cmd_spy(self, current_player: Player, parts: List[str], x: int, y: int):
+        if len(parts) == 2:
+            target_id = int(parts[1])
+            target = self.player_manager.get_player(target_id)
+            if target:
+                spy_cost = current_player.get_spy_cost(target)
+                if current_player.money >= spy_cost:
+                    current_player.money -= spy_cost
+                    current_player.science.spied_empires[target_id] = True
+                    self.interface.state.message = f"Spy placed in {target.name}"
+                else:
+                    self.interface.state.message = "Not enough gold to place spy"
+
+    def _cmd_info(self, current_player: Player, parts: List[str], x: int, y: int):
+        self.interface.current_player = current_player
+        self.interface.state.active_screen = "info"
+
+    def _cmd_treasury(self, current_player: Player, parts: List[str], x: int, y: int):
+        self.interface.current_player = current_player
+        self.interface.state.active_screen = "treasury"
+
+    def _cmd_decrease_tax(self, current_player: Player, parts: List[str], x: int, y: int):
+        if current_player.tax_rate >= 10:
+            current_player.tax_rate = max(0, current_player.tax_rate - 10)
+            self.interface.state.message = f"Tax rate decreased to {current_player.tax_rate:.1f}%"
+            # Update treasury screen to show new projected income
+            if self.interface.state.active_screen == "treasury":
+                self.interface.current_player = current_player
+
+    def _cmd_increase_tax(self, current_player: Player, parts: List[str], x: int, y: int):
+        if current_player.tax_rate <= 90:
+            current_player.tax_rate = min(100, current_player.tax_rate + 10)
+            self.interface.state.message = f"Tax rate increased to {current_player.tax_rate:.1f}%"
+            # Update treasury screen to show new projected income
+            if self.interface.state.active_screen == "treasury":
+                self.interface.current_player = current_player
+
+    def _cmd_science(self, current_player: Player, parts: List[str], x: int, y: int):
+        self.interface.current_player = current_player
+        self.interface.state.active_screen = "science"
+
+    def _cmd_diplomacy(self, current_player: Player, parts: List[str], x: int, y: int):
+        self.interface.current_player = current_player
+        self.interface.state.active_screen = "diplomacy"
+
+    def _cmd_help(self, current_player: Player, parts: List[str], x: int, y: int):
+        self._display_help_file("how.hlp")
+
+    def _cmd_end_turn(self, current_player: Player, parts: List[str], x: int, y: int):
+        self._handle_end_turn()
+
+    def _cmd_save_game(self, current_player: Player, parts: List[str], x: int, y: int):
+        save_num = self.interface.state.save_number
+        filename = f"save{save_num}.scn"
+        if self.save_game(filename):
+            self.interface.state.message = f"Game saved as {filename}"
+            self.interface.state.save_number += 1
+
+    def _cmd_quit(self, current_player: Player, parts: List[str], x: int, y: int):
+        self.running = False
+
+    def _cmd_embark(self, current_player: Player, parts: List[str], x: int, y: int):
+        self._handle_embark_command(current_player, x, y)
+
+    def _cmd_spend_science(self, current_player: Player, first: str,
+                           second: str, x: int, y: int):
+        branch = int(first)
+        amount = int(second)
+
+        # Spend money on science
+        progress = self.player_manager.spend_on_science(current_player, branch, amount)
+        if progress > 0:
+            self.interface.state.message = f"Advanced {BRANCH_NAMES[branch - 1]} by {progress:.2f} levels"
+        else:
+            self.interface.state.message = "Could not advance science"
+
+    def _cmd_set_negative(self, current_player: Player, first: str,
+                          second: str, x: int, y: int):
+        target_id = int(first)
+        target_player = self.player_manager.get_player(target_id)
+        if target_player:
+            # Set diplomatic relations to hostile (2)
+            current_player.diplomatic_relations[target_id] = 2
+            target_player.diplomatic_relations[current_player.id] = 2
+            self.interface.state.message = f"Relations with {target_player.name} set to hostile"
+
+    def _cmd_improve_relations(self, current_player: Player, first: str,
+                               second: str, x: int, y: int):
+        target_id = int(first)
+        if self.player_manager.change_diplomatic_relation(current_player, target_id, 1):
             target_player = self.player_manager.get_player(target_id)
             if target_player:
-                # Set diplomatic relations to hostile (2)
-                current_player.diplomatic_relations[target_id] = 2
-                target_player.diplomatic_relations[current_player.id] = 2
-                self.interface.state.message = f"Relations with {target_player.name} set to hostile"
-        elif command.startswith("improve_relations_"):
-            target_id = int(command.split("_")[-1])
-            if self.player_manager.change_diplomatic_relation(current_player, target_id, 1):
-                target_player = self.player_manager.get_player(target_id)
-                if target_player:
-                    # Also improve relations for target player
-                    target_player.diplomatic_relations[current_player.id] = current_player.diplomatic_relations[target_id]
-                    self.interface.state.message = f"Relations improved with {target_player.name}"
-    
+                # Also improve relations for target player
+                target_player.diplomatic_relations[current_player.id] = current_player.diplomatic_relations[target_id]
+                self.interface.state.message = f"Relations improved with {target_player.name}"
+
+    def _neighbors(self, x: int, y: int):
+        """Gather layer values for the in-bounds 4-neighbors of (x, y)
+
+        Returns aligned (owner, terrain, army, xs, ys) arrays in
+        left/right/up/down order.
+        """
+        xs = x + self._NEIGH_DX
+        ys = y + self._NEIGH_DY
+        size = self.MAP_SIZE
+        valid = (0 <= xs) & (xs < size) & (0 <= ys) & (ys < size)
+        xs, ys = xs[valid], ys[valid]
+        return self.owner[ys, xs], self.terrain[ys, xs], self.army[ys, xs], xs, ys
+
     def _handle_embark_command(self, player: Player, x: int, y: int):
         """Handle army embarking and naval invasions"""
-        unit_size = [1, 2, 5, 10, 20, 50, 100][self.interface.state.code - 1]
-        
+        state = self.interface.state
+        unit_size = self._UNIT_SIZES[state.code - 1]
+
         # Check if trying to invade enemy territory
-        if self.game_map["owner"][y][x] != player.id and self.game_map["owner"][y][x] != 0:
+        if self.owner[y, x] != player.id and self.owner[y, x] != 0:
             # Look for adjacent friendly territory with enough units and sea tiles
-            friendly_territory_found = False
+            neigh_owner, neigh_terrain, neigh_army, xs, ys = self._neighbors(x, y)
+            friendly = (neigh_owner == player.id) & (neigh_army >= unit_size)
+            friendly_territory_found = bool(friendly.any())
+            sea_tile_found = bool(((neigh_terrain == 0) & ~friendly).any())
+
             friendly_x, friendly_y = None, None
-            sea_tile_found = False
-            
-            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                new_x, new_y = x + dx, y + dy
-                if 0 <= new_x < 15 and 0 <= new_y < 15:
-                    # Check for friendly territory with enough units
-                    if (self.game_map["owner"][new_y][new_x] == player.id and 
-                        self.game_map["army"][new_y][new_x] >= unit_size):
-                        friendly_territory_found = True
-                        friendly_x, friendly_y = new_x, new_y
-                    # Check for sea tile
-                    elif self.game_map["terrain"][new_y][new_x] == 0:
-                        sea_tile_found = True
+            if friendly_territory_found:
+                # Keep the last match, as the old scan order did
+                idx = int(np.flatnonzero(friendly)[-1])
+                friendly_x, friendly_y = int(xs[idx]), int(ys[idx])
             
             if friendly_territory_found and sea_tile_found:
-                enemy_id = self.game_map["owner"][y][x]
+                enemy_id = self.owner[y, x]
                 enemy = self.player_manager.get_player(enemy_id)
                 if enemy:
                     # First embark the units from friendly territory to sea
@@ -349,51 +636,47 @@ class Game:
                         # Apply battle results
                         if battle_result.territory_captured:
                             # Update territory ownership
-                            self.game_map["owner"][y][x] = player.id
+                            self.owner[y, x] = player.id
+                            self._mark_owner_changed()
                             # Transfer any remaining army units
                             remaining_units = unit_size - battle_result.attacker_losses
                             if remaining_units > 0:
-                                self.game_map["army"][y][x] = remaining_units
+                                self.army[y, x] = remaining_units
                             # Update message
-                            self.interface.state.message = f"Victory! Territory captured from {enemy.name}"
+                            state.message = f"Victory! Territory captured from {enemy.name}"
                         else:
-                            self.interface.state.message = battle_result.message
+                            state.message = battle_result.message
                         return
             else:
                 if not friendly_territory_found:
-                    self.interface.state.message = "No adjacent friendly territory with enough units"
+                    state.message = "No adjacent friendly territory with enough units"
                 elif not sea_tile_found:
-                    self.interface.state.message = "No adjacent sea tiles for naval invasion"
+                    state.message = "No adjacent sea tiles for naval invasion"
                 return
         
         # Handle normal embarking from owned territory
-        if self.game_map["owner"][y][x] != player.id:
-            self.interface.state.message = "You don't own this territory"
+        if self.owner[y, x] != player.id:
+            state.message = "You don't own this territory"
             return
             
         # Check if enough units available
-        if self.game_map["army"][y][x] < unit_size:
-            self.interface.state.message = f"Not enough units (need {unit_size})"
+        if self.army[y, x] < unit_size:
+            state.message = f"Not enough units (need {unit_size})"
             return
         
         # Look for adjacent sea tiles and check for enemy territories
-        enemy_territory_found = False
-        enemy_id = None
-        sea_tile_found = False
+        neigh_owner, neigh_terrain, _, xs, ys = self._neighbors(x, y)
+        enemy = (neigh_owner != 0) & (neigh_owner != player.id)
+        sea = neigh_terrain == 0
+
+        enemy_territory_found = bool(enemy.any())
+        enemy_id = int(neigh_owner[np.flatnonzero(enemy)[-1]]) if enemy_territory_found else None
+
+        sea_tile_found = bool(sea.any())
         embark_x, embark_y = None, None
-        
-        for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-            new_x, new_y = x + dx, y + dy
-            if 0 <= new_x < 15 and 0 <= new_y < 15:
-                # Check for enemy territory
-                owner_id = self.game_map["owner"][new_y][new_x]
-                if owner_id != 0 and owner_id != player.id:
-                    enemy_territory_found = True
-                    enemy_id = owner_id
-                # Check for sea tile
-                if self.game_map["terrain"][new_y][new_x] == 0:
-                    sea_tile_found = True
-                    embark_x, embark_y = new_x, new_y
+        if sea_tile_found:
+            idx = int(np.flatnonzero(sea)[-1])
+            embark_x, embark_y = int(xs[idx]), int(ys[idx])
         
         # If there's enemy territory adjacent, initiate battle
         if enemy_territory_found and sea_tile_found:
@@ -418,15 +701,16 @@ class Game:
                     # Apply battle results
                     if battle_result.territory_captured:
                         # Update territory ownership
-                        self.game_map["owner"][y][x] = player.id
+                        self.owner[y, x] = player.id
+                        self._mark_owner_changed()
                         # Transfer any remaining army units
                         remaining_units = unit_size - battle_result.attacker_losses
                         if remaining_units > 0:
-                            self.game_map["army"][y][x] = remaining_units
+                            self.army[y, x] = remaining_units
                         # Update message
-                        self.interface.state.message = f"Victory! Territory captured from {enemy.name}"
+                        state.message = f"Victory! Territory captured from {enemy.name}"
                     else:
-                        self.interface.state.message = battle_result.message
+                        state.message = battle_result.message
                     return
         
         # If no enemy territory or just embarking to sea
@@ -437,70 +721,37 @@ class Game:
                 self.game_map["army"],
                 self.game_map["terrain"]
             ):
-                self.interface.state.message = f"Embarked {unit_size} units"
+                state.message = f"Embarked {unit_size} units"
                 return
         
-        self.interface.state.message = "No adjacent sea tiles to embark to"
+        state.message = "No adjacent sea tiles to embark to"
     
     def _handle_end_turn(self):
         """Handle end of turn processing"""
-        current_player = self.player_manager.get_player(
-            self.player_manager.current_player_id
-        )
-        
+        state = self.interface.state
+        pm = self.player_manager
+        current_player = pm.players.get(pm.current_player_id)
+
         # Update current player state
-        self.player_manager.calculate_morale(current_player)
-        self.player_manager.update_science(current_player)
-        
-        # Calculate total food potential from owned territories
-        total_food_potential = 0
-        territory_count = 0
-        for y in range(15):
-            for x in range(15):
-                if self.game_map["owner"][y][x] == current_player.id:
-                    terrain_id = self.game_map["terrain"][y][x]
-                    total_food_potential += self.terrain_manager.get_food_potential(terrain_id)
-                    territory_count += 1
+        pm.calculate_morale(current_player)
+        pm.update_science(current_player)
         
+        # Territory stats come from the owner-versioned cache, so idle
+        # AI turns with no conquests skip the grid scans entirely
+        (total_food_potential, territory_count, land_tiles, sea_tiles,
+         total_production, trade_routes) = self._player_terrain_stats(
+            current_player.id
+        )
+
         # Calculate average food potential per territory
         avg_food_potential = total_food_potential / max(territory_count, 1)
-        
+
         # Calculate and apply population growth
         growth = self.player_manager.calculate_population_growth(current_player, avg_food_potential)
         current_player.population += growth
-        
+
         # Distribute new population into working groups
         if growth > 0:
-            # Calculate ratios based on terrain types in owned territories
-            land_tiles = 0
-            sea_tiles = 0
-            total_production = 0
-            trade_routes = 0
-            
-            for y in range(15):
-                for x in range(15):
-                    if self.game_map["owner"][y][x] == current_player.id:
-                        terrain_id = self.game_map["terrain"][y][x]
-                        terrain = self.terrain_manager.get_terrain(terrain_id)
-                        
-                        if terrain_id == 0:  # Sea terrain
-                            sea_tiles += 1
-                        else:
-                            land_tiles += 1
-                            
-                        if terrain.production_potential > 0:
-                            total_production += 1
-                        
-                        # Count adjacent owned territories as trade routes
-                        adjacent_owned = 0
-                        for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                            nx, ny = x + dx, y + dy
-                            if (0 <= nx < 15 and 0 <= ny < 15 and 
-                                self.game_map["owner"][ny][nx] == current_player.id):
-                                adjacent_owned += 1
-                        if adjacent_owned > 0:
-                            trade_routes += 1
-            
             # Distribute new population based on territory composition
             total_tiles = max(1, land_tiles + sea_tiles)
             
@@ -533,58 +784,55 @@ class Game:
             current_player.unemployed += remaining
         
         # Update player's money with income
-        income = self.player_manager.calculate_income(current_player)
+        income = pm.calculate_income(current_player)
         current_player.money += income
         
-        # Recalculate land counts for all players
-        for player in self.player_manager.players.values():
-            player.land_count = 0
-            for y in range(15):
-                for x in range(15):
-                    if self.game_map["owner"][y][x] == player.id:
-                        player.land_count += 1
+        # Recalculate land counts for all players in one counting pass
+        owned_counts = np.bincount(
+            self.owner.ravel(),
+            minlength=pm.max_players + 1
+        )
+        for player in pm.players.values():
+            player.land_count = int(owned_counts[player.id])
         
         # Get next player
-        next_player = self.player_manager.next_player()
-        
+        next_player = pm.next_player()
+
         if not next_player:
             # No valid players left
-            self.interface.state.message = "Game Over - No valid players remaining"
+            state.message = "Game Over - No valid players remaining"
             self.running = False
             return
             
         # Reset state for next player's turn
-        self.player_manager.reset_diplomatic_changes(next_player)
+        pm.reset_diplomatic_changes(next_player)
         
         # Reset moved units for all territories
-        for y in range(15):
-            for x in range(15):
-                self.game_map["moved"][y][x] = 0
-                
-        # Process AI turns immediately
+        self.moved.fill(0)
+
+        # Process AI turns immediately; batch the shared map facts once
+        self.ai.begin_tick(self.game_map)
         while next_player and next_player.control != "human":
             # Let AI make decisions
             self.ai.make_decisions(next_player, self.game_map)
             
             # Update AI player state
-            self.player_manager.calculate_morale(next_player)
-            self.player_manager.update_science(next_player)
-            
+            pm.calculate_morale(next_player)
+            pm.update_science(next_player)
+
             # Update AI player's money with income
-            income = self.player_manager.calculate_income(next_player)
+            income = pm.calculate_income(next_player)
             next_player.money += income
             
             # Reset moved units for next AI player
-            for y in range(15):
-                for x in range(15):
-                    self.game_map["moved"][y][x] = 0
-            
+            self.moved.fill(0)
+
             # Get next player
-            next_player = self.player_manager.next_player()
+            next_player = pm.next_player()
             
             # Check if game is over
             if not next_player:
-                self.interface.state.message = "Game Over - No valid players remaining"
+                state.message = "Game Over - No valid players remaining"
                 self.running = False
                 return
         
@@ -593,216 +841,166 @@ class Game:
             
         # Update interface references and game state
         self.interface.current_player = next_player
-        self.interface.all_players = self.player_manager.players  # Ensure player list is updated
-        self.interface.state.message = f"{next_player.name}'s turn"
-        self.player_manager.current_player_id = next_player.id  # Ensure current player ID is updated
+        state.message = f"{next_player.name}'s turn"
+        pm.current_player_id = next_player.id  # Ensure current player ID is updated
     
     def _handle_build_command(self, building: str, player: Player, x: int, y: int):
         """Handle building construction"""
-        if self.game_map["owner"][y][x] != player.id:
-            self.interface.state.message = "You don't own this territory"
+        state = self.interface.state
+        if self.owner[y, x] != player.id:
+            state.message = "You don't own this territory"
             return
             
-        terrain_type = self.terrain_manager.get_terrain(self.game_map["terrain"][y][x])
-        terrain_name = terrain_type.name.lower()
-        
-        # Initialize cost
-        cost = 0
-        
-        # Check terrain restrictions
-        if building == "fort":
-            if terrain_name == "sea":
-                self.interface.state.message = "Cannot build fort on sea"
-                return
-            elif terrain_name == "swamp":
-                self.interface.state.message = "Cannot build fort in swamp"
-                return
-            cost = self.military_manager.FORT_COST
-            if player.money < cost:
-                self.interface.state.message = f"Not enough gold (need {cost})"
-                return
-            self.game_map["fort"][y][x] += 1
-            player.money -= cost
-            self.interface.state.message = f"Built fort for {cost} gold"
-                
-        elif building == "church":
-            if terrain_name == "sea":
-                self.interface.state.message = "Cannot build church on sea"
-                return
-            elif terrain_name == "mountain":
-                self.interface.state.message = "Cannot build church on mountain"
-                return
-            cost = self.military_manager.CHURCH_COST
-            if player.money < cost:
-                self.interface.state.message = f"Not enough gold (need {cost})"
-                return
-            self.game_map["church"][y][x] += 1
-            player.money -= cost
-            self.interface.state.message = f"Built church for {cost} gold"
-                
-        elif building == "university":
-            if terrain_name == "sea":
-                self.interface.state.message = "Cannot build university on sea"
-                return
-            elif terrain_name in ["mountain", "swamp", "desert"]:
-                self.interface.state.message = f"Cannot build university on {terrain_name}"
-                return
-            cost = self.military_manager.UNIVERSITY_COST
-            if player.money < cost:
-                self.interface.state.message = f"Not enough gold (need {cost})"
-                return
-            self.game_map["university"][y][x] += 1
-            player.money -= cost
-            self.interface.state.message = f"Built university for {cost} gold"
-                
-        elif building == "mill":
-            if terrain_name == "sea":
-                self.interface.state.message = "Cannot build mill on sea"
-                return
-            elif terrain_name in ["desert", "tundra"]:
-                self.interface.state.message = f"Cannot build mill on {terrain_name}"
+        terrain_name = self._terrain_names[self.terrain[y, x]].lower()
+
+        # Static buildings share one table-driven path
+        rule = self._build_rules.get(building)
+        if rule is not None:
+            forbidden, cost, layer = rule
+            if terrain_name in forbidden:
+                state.message = f"Cannot build {building} on {terrain_name}"
                 return
-            cost = self.military_manager.MILL_COST
             if player.money < cost:
-                self.interface.state.message = f"Not enough gold (need {cost})"
+                state.message = f"Not enough gold (need {cost})"
                 return
-            self.game_map["mill"][y][x] += 1
+            layer[y, x] += 1
             player.money -= cost
-            self.interface.state.message = f"Built mill for {cost} gold"
-                
-        elif building == "army":
-            if terrain_name == "sea":
-                self.interface.state.message = "Cannot recruit army on sea"
-                return
-                
-            unit_size = [1, 2, 5, 10, 20, 50, 100][self.interface.state.code - 1]
-            cost = self.military_manager.ARMY_COST * unit_size
-            
-            if player.money < cost:
-                self.interface.state.message = f"Not enough gold (need {cost})"
-                return
-                
-            # Calculate total available population
-            total_available = (player.unemployed + player.peasants + 
-                            player.workers + player.merchants)
-            
-            if total_available < unit_size:
-                self.interface.state.message = f"Not enough population (need {unit_size}, have {total_available})"
-                return
-            
-            # Deduct population in priority order
+            state.message = f"Built {building} for {cost} gold"
+            return
+
+        handler = self._build_dispatch.get(building)
+        if handler is not None:
+            handler(player, x, y, terrain_name, state)
+        else:
+            state.message = f"Unknown building type: {building}"
+
+    def _build_army(self, player: Player, x: int, y: int,
+                    terrain_name: str, state) -> None:
+        """Recruit an army unit on an owned land tile"""
+        if terrain_name == "sea":
+            state.message = "Cannot recruit army on sea"
+            return
+
+        unit_size = self._UNIT_SIZES[state.code - 1]
+        cost = self.military_manager.ARMY_COST * unit_size
+
+        if player.money < cost:
+            state.message = f"Not enough gold (need {cost})"
+            return
+
+        # Calculate total available population
+        total_available = (player.unemployed + player.peasants +
+                        player.workers + player.merchants)
+
+        if total_available < unit_size:
+            state.message = f"Not enough population (need {unit_size}, have {total_available})"
+            return
+
+        # Deduct population in priority order; the availability
+        # check above guarantees the pools cover unit_size. Single
+        # recruits (the common AI case) skip the generic loop.
+        if unit_size == 1:
+            if player.unemployed:
+                player.unemployed -= 1
+            elif player.peasants:
+                player.peasants -= 1
+            elif player.workers:
+                player.workers -= 1
+            else:
+                player.merchants -= 1
+        else:
             remaining = unit_size
-            
-            # First use unemployed
-            if remaining > 0 and player.unemployed > 0:
-                used = min(remaining, player.unemployed)
-                player.unemployed -= used
-                remaining -= used
-            
-            # Then use peasants
-            if remaining > 0 and player.peasants > 0:
-                used = min(remaining, player.peasants)
-                player.peasants -= used
-                remaining -= used
-            
-            # Then use workers
-            if remaining > 0 and player.workers > 0:
-                used = min(remaining, player.workers)
-                player.workers -= used
-                remaining -= used
-            
-            # Finally use merchants
-            if remaining > 0 and player.merchants > 0:
-                used = min(remaining, player.merchants)
-                player.merchants -= used
-                remaining -= used
-            
-            self.game_map["army"][y][x] += unit_size
-            player.money -= cost
-            self.interface.state.message = f"Recruited army of {unit_size} for {cost} gold"
-            
-        elif building == "navy":
-            # Check if we're trying to build on a sea tile
-            if terrain_name != "sea":
-                self.interface.state.message = "Must build navy on sea tile"
-                return
-                
-            # Check if there's adjacent owned land
-            has_adjacent_land = False
-            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < 15 and 0 <= new_y < 15 and 
-                    self.game_map["owner"][new_y][new_x] == player.id and
-                    self.game_map["terrain"][new_y][new_x] != 0):  # Not sea
-                    has_adjacent_land = True
+            for attr in ("unemployed", "peasants", "workers", "merchants"):
+                pool = getattr(player, attr)
+                take = remaining if remaining < pool else pool
+                setattr(player, attr, pool - take)
+                remaining -= take
+                if not remaining:
                     break
-                    
-            if not has_adjacent_land:
-                self.interface.state.message = "Must build navy adjacent to owned land"
-                return
-                
-            unit_size = [1, 2, 5, 10, 20, 50, 100][self.interface.state.code - 1]
-            cost = self.military_manager.NAVY_COST * unit_size
-            
-            if player.money < cost:
-                self.interface.state.message = f"Not enough gold (need {cost})"
-                return
-                
-            player.navy += unit_size
-            player.money -= cost
-            self.interface.state.message = f"Built {unit_size} ships for {cost} gold"
-            
-        else:
-            self.interface.state.message = f"Unknown building type: {building}"
+
+        self.army[y, x] += unit_size
+        player.money -= cost
+        state.message = f"Recruited army of {unit_size} for {cost} gold"
+
+    def _build_navy(self, player: Player, x: int, y: int,
+                    terrain_name: str, state) -> None:
+        """Build ships on an owned sea tile next to owned land"""
+        # Check if we're trying to build on a sea tile
+        if terrain_name != "sea":
+            state.message = "Must build navy on sea tile"
+            return
+
+        # Check if there's adjacent owned land with four direct
+        # probes, bounds short-circuited so the or-chain exits on
+        # the first hit
+        owner, terrain, pid = self.owner, self.terrain, player.id
+        edge = self.MAP_SIZE - 1
+        has_adjacent_land = (
+            (y > 0 and owner[y-1, x] == pid and terrain[y-1, x] != 0) or
+            (y < edge and owner[y+1, x] == pid and terrain[y+1, x] != 0) or
+            (x > 0 and owner[y, x-1] == pid and terrain[y, x-1] != 0) or
+            (x < edge and owner[y, x+1] == pid and terrain[y, x+1] != 0)
+        )
+
+        if not has_adjacent_land:
+            state.message = "Must build navy adjacent to owned land"
+            return
+
+        unit_size = self._UNIT_SIZES[state.code - 1]
+        cost = self.military_manager.NAVY_COST * unit_size
+
+        if player.money < cost:
+            state.message = f"Not enough gold (need {cost})"
+            return
+
+        player.navy += unit_size
+        player.money -= cost
+        state.message = f"Built {unit_size} ships for {cost} gold"
     
     def _handle_sell_command(self, building: str, player: Player, x: int, y: int):
         """Handle selling buildings and units"""
-        if self.game_map["owner"][y][x] != player.id:
-            self.interface.state.message = "You don't own this territory"
+        state = self.interface.state
+        if self.owner[y, x] != player.id:
+            state.message = "You don't own this territory"
             return
             
         refund = 0
-        if building == "fort" and self.game_map["fort"][y][x] > 0:
-            refund = int(self.military_manager.FORT_COST * self.military_manager.FORT_SELL)
-            self.game_map["fort"][y][x] -= 1
-        elif building == "church" and self.game_map["church"][y][x] > 0:
-            refund = int(self.military_manager.CHURCH_COST * self.military_manager.CHURCH_SELL)
-            self.game_map["church"][y][x] -= 1
-        elif building == "university" and self.game_map["university"][y][x] > 0:
-            refund = int(self.military_manager.UNIVERSITY_COST * self.military_manager.UNIVERSITY_SELL)
-            self.game_map["university"][y][x] -= 1
-        elif building == "mill" and self.game_map["mill"][y][x] > 0:
-            refund = int(self.military_manager.MILL_COST * self.military_manager.MILL_SELL)
-            self.game_map["mill"][y][x] -= 1
-        elif building == "army" and self.game_map["army"][y][x] > 0:
-            unit_size = [1, 2, 5, 10, 20, 50, 100][self.interface.state.code - 1]
-            if self.game_map["army"][y][x] >= unit_size:
+        rule = self._sell_rules.get(building)
+        if rule is not None:
+            sale_value, layer = rule
+            if layer[y, x] > 0:
+                refund = sale_value
+                layer[y, x] -= 1
+        elif building == "army" and (army := self.army)[y, x] > 0:
+            unit_size = self._UNIT_SIZES[state.code - 1]
+            if army[y, x] >= unit_size:
                 refund = int(self.military_manager.ARMY_COST * self.military_manager.ARMY_SELL * unit_size)
-                self.game_map["army"][y][x] -= unit_size
+                army[y, x] -= unit_size
             else:
-                self.interface.state.message = f"Not enough units (need {unit_size})"
+                state.message = f"Not enough units (need {unit_size})"
                 return
         elif building == "navy" and player.navy > 0:
-            unit_size = [1, 2, 5, 10, 20, 50, 100][self.interface.state.code - 1]
+            unit_size = self._UNIT_SIZES[state.code - 1]
             if player.navy >= unit_size:
                 refund = int(self.military_manager.NAVY_COST * self.military_manager.NAVY_SELL * unit_size)
                 player.navy -= unit_size
             else:
-                self.interface.state.message = f"Not enough naval units (need {unit_size})"
+                state.message = f"Not enough naval units (need {unit_size})"
                 return
         
         if refund > 0:
             player.money += refund
-            self.interface.state.message = f"Sold {building} for {refund} gold"
+            state.message = f"Sold {building} for {refund} gold"
         else:
-            self.interface.state.message = f"Nothing to sell"
+            state.message = f"Nothing to sell"
 
     def _handle_move_command(self, direction: str, player: Player, x: int, y: int):
         """Handle army movement"""
-        if self.game_map["owner"][y][x] != player.id:
+        state = self.interface.state
+        if self.owner[y, x] != player.id:
             return
             
-        unit_size = [1, 2, 5, 10, 20, 50, 100][self.interface.state.code - 1]
+        unit_size = self._UNIT_SIZES[state.code - 1]
         
         new_x, new_y = x, y
         if direction == "up": new_y -= 1
@@ -810,68 +1008,86 @@ class Game:
         elif direction == "left": new_x -= 1
         elif direction == "right": new_x += 1
         
-        if 0 <= new_x < 15 and 0 <= new_y < 15:
+        if 0 <= new_x < self.MAP_SIZE and 0 <= new_y < self.MAP_SIZE:
             if self.military_manager.move_army(
                 unit_size, x, y, new_x, new_y,
                 player,
-                self.game_map["army"],
-                self.game_map["moved"],
-                self.game_map["terrain"]
+                self.army,
+                self.moved,
+                self.terrain
             ):
-                self.interface.state.message = f"Moved {unit_size} units"
+                state.message = f"Moved {unit_size} units"
             else:
-                self.interface.state.message = "Invalid move"
+                state.message = "Invalid move"
     
     def run(self):
         """Main game loop"""
         # Set initial interface references
-        current_player = self.player_manager.get_player(self.player_manager.current_player_id)
+        current_player = self._cached_current_player()
         if current_player:
             self.interface.current_player = current_player
-            self.interface.all_players = self.player_manager.players
-            
+
+        # The game is keyboard-driven; block everything else at the SDL
+        # layer so mouse motion and window chatter never reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
+
+        # Redraw only when input or game state changed; the clock caps
+        # the loop so idle frames cost almost nothing
+        dirty = True
         while self.running:
+            # Block until input arrives (or the timeout elapses) so an
+            # idle loop sleeps in the OS instead of spinning on an
+            # empty queue; any burst behind the first event is drained
+            first = pygame.event.wait(33)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
+                dirty = True
                 if event.type == pygame.QUIT:
                     self.running = False
                 else:
                     command = self.interface.handle_input(event)
                     self.handle_command(command)
-            
-            # Clear screen
-            self.interface.clear()
-            
-            # Draw game state if no screen is active
-            if not self.interface.state.help_content and not self.interface.state.active_screen:
-                self.interface.draw_title()
-                self.interface.draw_map(
-                    self.game_map["terrain"],
-                    self.game_map["owner"],
-                    [0, 2, 4, 1, 14, 8, 15, 11, 13, 12],  # Owner colors
-                    [t.color for t in self.terrain_manager.terrain_types]
-                )
-                
-                current_player = self.player_manager.get_player(
-                    self.player_manager.current_player_id
-                )
-                if current_player:
-                    self.interface.draw_info_panel(
-                        current_player.name,
-                        self.turn,
-                        current_player.money,
-                        self.get_territory_info(
-                            self.interface.state.selected_x,
-                            self.interface.state.selected_y
-                        )
+
+            if dirty:
+                # Clear screen
+                self.interface.clear()
+
+                # Draw game state if no screen is active
+                if not self.interface.state.help_content and not self.interface.state.active_screen:
+                    self.interface.draw_title()
+                    self.interface.draw_map(
+                        self.terrain,
+                        self.owner,
+                        self._owner_colors,
+                        self._terrain_colors
                     )
-                
-                self.interface.draw_menu()
-                self.interface.draw_message()
-                self.interface.draw_unit_size()
-            
-            # Update display
-            self.interface.update()
+
+                    current_player = self._cached_current_player()
+                    if current_player:
+                        self.interface.draw_info_panel(
+                            current_player.name,
+                            self.turn,
+                            current_player.money,
+                            self.get_territory_info(
+                                self.interface.state.selected_x,
+                                self.interface.state.selected_y
+                            )
+                        )
+
+                    self.interface.draw_menu()
+                    self.interface.draw_message()
+                    self.interface.draw_unit_size()
+
+                # Update display
+                self.interface.update()
+                dirty = False
+
+            self.clock.tick(30)
         
         pygame.quit()
         sys.exit()
@@ -887,25 +1103,36 @@ class Game:
 
 if __name__ == "__main__":
     game = Game()
-    
+
+    # Pace the splash loops so they sleep between redraws instead of
+    # spinning a core while waiting for input; the event queue is
+    # drained once per frame and handed to the active screen
+    splash_clock = pygame.time.Clock()
+
+    # The splash screens only care about quit and key presses, so pull
+    # just those and let SDL drop the mouse-motion firehose
+    _SPLASH_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
+
     # Show motto screen until key press
     while game.interface.show_motto_screen:
-        if game.interface.show_motto():
+        if game.interface.show_motto(pygame.event.get(_SPLASH_EVENTS)):
             break
-            
+        splash_clock.tick(60)
+
     # Show title screen until key press
     while game.interface.show_title_screen:
-        if game.interface.show_title():
+        if game.interface.show_title(pygame.event.get(_SPLASH_EVENTS)):
             break
-    
+        splash_clock.tick(60)
+
     # Show country selection until confirmed
     selected_country = None
     while game.interface.show_country_select and selected_country is None:
-        selected_country = game.interface.show_country_selection()
+        selected_country = game.interface.show_country_selection(pygame.event.get(_SPLASH_EVENTS))
         if selected_country == -1:  # Quit
             pygame.quit()
             sys.exit()
-        pygame.event.pump()  # Process events to keep window responsive
+        splash_clock.tick(60)
     
     # Load scenario and set player control
     if game.load_scenario("default.scn"):
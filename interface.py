@@ -1,9 +1,52 @@
+import numpy as np
 import pygame
 import pygame.freetype
 from typing import Dict, List, Tuple, Optional, Callable
 from dataclasses import dataclass
+from player import PlayerManager
 
-@dataclass
+# Military unit sizes selectable with +/- (mirrors Game._UNIT_SIZES)
+_UNIT_SIZES = (1, 2, 5, 10, 20, 50, 100)
+
+# Highest valid map coordinate (15x15 grid)
+_MAX_COORD = 14
+
+# Diplomatic status names by relation level
+_STATUS_NAMES = {
+    1: "War",
+    2: "Hostile",
+    3: "Neutral",
+    4: "Friendly",
+    5: "Allied",
+}
+
+# Improve-relations key per nation id (1-9)
+_DIPLO_KEYS = ("o", "p", "[", "]", "l", "\\", "l", ".", "/")
+
+# Science branch names and their spend keys, indexed by branch - 1
+_SCIENCE_BRANCHES = (
+    ("Agriculture", "1"),
+    ("Industry", "2"),
+    ("Trade", "3"),
+    ("Sailing", "4"),
+    ("Military", "5"),
+    ("Medicine", "6"),
+)
+
+# Improve-relations keys accepted by the diplomacy screen, by nation id
+_KEY_TO_NATION = {
+    'o': 1,
+    'p': 2,
+    '[': 3,
+    ']': 4,
+    'l': 5,
+    "'": 6,
+    ',': 7,
+    '.': 8,
+    '/': 9,
+}
+
+@dataclass(slots=True)
 class UIState:
     selected_x: int = 8
     selected_y: int = 8
@@ -15,6 +58,43 @@ class UIState:
     active_screen: str = None  # Current active game screen
 
 class Interface:
+    # Keyboard bindings resolved with O(1) dict lookups instead of an
+    # if/elif ladder; the shift table also carries the screen commands
+    # that ignore the modifier
+    _LOWER_CMDS = {
+        pygame.K_i: "info",
+        pygame.K_t: "treasury",
+        pygame.K_s: "science",
+        pygame.K_d: "diplomacy",
+        pygame.K_f: "build_fort",
+        pygame.K_c: "build_church",
+        pygame.K_u: "build_university",
+        pygame.K_m: "build_mill",
+        pygame.K_a: "build_army",
+        pygame.K_n: "build_navy",
+        pygame.K_b: "embark",
+        pygame.K_e: "end_turn",
+        pygame.K_g: "save_game",
+        pygame.K_h: "help",
+        pygame.K_q: "quit",
+    }
+    _SHIFT_CMDS = {
+        pygame.K_i: "info",
+        pygame.K_t: "treasury",
+        pygame.K_s: "science",
+        pygame.K_d: "diplomacy",
+        pygame.K_f: "sell_fort",
+        pygame.K_c: "sell_church",
+        pygame.K_u: "sell_university",
+        pygame.K_m: "sell_mill",
+        pygame.K_a: "sell_army",
+        pygame.K_n: "sell_navy",
+    }
+    _DIGIT_KEYS = frozenset((
+        pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+        pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9,
+    ))
+
     def __init__(self, screen_width: int = 900, screen_height: int = 600):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -27,7 +107,7 @@ class Interface:
         
         # Load title screen image and motto
         try:
-            self.title_image = pygame.image.load("HGM.BMP")
+            self.title_image = pygame.image.load("HGM.BMP").convert()
             self.title_image = pygame.transform.scale(self.title_image, (screen_width, screen_height))
             
             # Load motto
@@ -55,28 +135,91 @@ class Interface:
         self.font = pygame.freetype.SysFont("Arial", 14)
         self.title_font = pygame.freetype.SysFont("Arial", 18, bold=True)
         
-        # Colors (matching QBasic colors)
-        self.colors = {
-            0: (0, 0, 0),        # Black
-            1: (0, 0, 170),      # Blue
-            2: (0, 170, 0),      # Green
-            3: (0, 170, 170),    # Cyan
-            4: (170, 0, 0),      # Red
-            5: (170, 0, 170),    # Magenta
-            6: (170, 85, 0),     # Brown
-            7: (170, 170, 170),  # Light Gray
-            8: (85, 85, 85),     # Dark Gray
-            9: (85, 85, 255),    # Light Blue
-            10: (85, 255, 85),   # Light Green
-            11: (85, 255, 255),  # Light Cyan
-            12: (255, 85, 85),   # Light Red
-            13: (255, 85, 255),  # Light Magenta
-            14: (255, 255, 85),  # Yellow
-            15: (255, 255, 255), # White
-        }
-        
+        # Colors (matching QBasic colors), indexed 0-15
+        self.colors = (
+            (0, 0, 0),        # 0: Black
+            (0, 0, 170),      # 1: Blue
+            (0, 170, 0),      # 2: Green
+            (0, 170, 170),    # 3: Cyan
+            (170, 0, 0),      # 4: Red
+            (170, 0, 170),    # 5: Magenta
+            (170, 85, 0),     # 6: Brown
+            (170, 170, 170),  # 7: Light Gray
+            (85, 85, 85),     # 8: Dark Gray
+            (85, 85, 255),    # 9: Light Blue
+            (85, 255, 85),    # 10: Light Green
+            (85, 255, 255),   # 11: Light Cyan
+            (255, 85, 85),    # 12: Light Red
+            (255, 85, 255),   # 13: Light Magenta
+            (255, 255, 85),   # 14: Yellow
+            (255, 255, 255),  # 15: White
+        )
+
+        self._palette = np.array(self.colors, dtype=np.uint8)
+
+        # Country-selection labels pre-rendered in both the selected
+        # (yellow) and unselected (gray) variants
+        self._country_surfs = [
+            (
+                self.font.render(c, self.colors[14])[0],
+                self.font.render(c, self.colors[7])[0],
+            )
+            for c in self.countries
+        ]
+        self._country_title_surf = self.title_font.render(
+            "Select Your Country", self.colors[15]
+        )[0]
+        self._country_instr_surf = self.font.render(
+            "Use Up/Down arrows to select, Enter to confirm", self.colors[14]
+        )[0]
+
         self.state = UIState()
-        
+
+        # Rasterized text cache: static labels render once and then
+        # blit; keyed by (text, color, bold). Bounded so a long session
+        # of changing values cannot grow it without limit.
+        self._label_cache = {}
+
+        # Map rendering caches: the QBasic palette as a (16, 3) uint8
+        # array for vectorized color gathers, a persistent per-size
+        # grid surface the terrain layer is written into, plus 5x5
+        # owner dots and the white selection outline for the overlay
+        # blits
+        self._dot_surfs = {}
+        self._select_surfs = {}
+        self._map_surfs = {}
+
+        # Word-wrapped motto lines, laid out lazily on first draw
+        self._motto_lines = None
+
+        # Stateless helper for income projections on the treasury
+        # screen, plus a per-player memo of the last result keyed by
+        # the inputs the formula reads
+        self._pm = PlayerManager()
+        self._income_cache = {}
+
+        # Info panel composite, reblitted while its contents are unchanged
+        self._panel_key = None
+        self._panel_surf = None
+
+        # Help lines with separators filtered out, rebuilt when a new
+        # help file is loaded
+        self._help_key = None
+        self._help_lines = []
+
+        # Science screen spend limits, keyed on the gold/levels state
+        # they were computed from
+        self._max_spend_key = None
+        self._max_spends = None
+        self._science_label_surf = None
+
+        # Per-screen key handlers, picked by active_screen
+        self._screen_handlers = {
+            "treasury": self._handle_treasury_key,
+            "science": self._handle_science_key,
+            "diplomacy": self._handle_diplomacy_key,
+        }
+
         # Menu definitions
         self.main_menu = [
             ("Empires", [
@@ -113,20 +256,59 @@ class Interface:
                 ("Quit", "Q"),
             ]),
         ]
-    
+
+        # The menu never changes, so bake it into one surface up front
+        self._menu_surf = self._build_menu_surface()
+
+    def _build_menu_surface(self) -> pygame.Surface:
+        """Flatten the menu tree into render lines and bake them into
+        a single surface"""
+        self._menu_lines = []
+        y = 0
+        for section_name, items in self.main_menu:
+            self._menu_lines.append((section_name, (0, y), self.colors[7]))
+            y += 20
+            for item_name, key in items:
+                if isinstance(key, list):
+                    # Submenu
+                    for sub_name, sub_key in key:
+                        self._menu_lines.append(
+                            (f"{sub_name} ({sub_key})", (20, y), self.colors[7])
+                        )
+                        y += 15
+                else:
+                    self._menu_lines.append(
+                        (f"{item_name} ({key})", (10, y), self.colors[7])
+                    )
+                    y += 15
+            y += 10
+
+        surf = pygame.Surface((130, self.screen_height - 80), pygame.SRCALPHA)
+        for text, pos, color in self._menu_lines:
+            self.font.render_to(surf, pos, text, color)
+        return surf.convert_alpha()
+
+
+    def _text(self, text: str, color, bold: bool = False) -> pygame.Surface:
+        """Memoized text rasterization; repeated strings cost one blit"""
+        key = (text, color, bold)
+        surf = self._label_cache.get(key)
+        if surf is None:
+            if len(self._label_cache) > 4096:
+                self._label_cache.clear()
+            font = self.title_font if bold else self.font
+            surf = font.render(text, color)[0].convert_alpha()
+            self._label_cache[key] = surf
+        return surf
+
     def draw_title(self):
         """Draw the game title and copyright"""
-        self.title_font.render_to(
-            self.screen,
-            (10, 10),
-            "HEGEMONY 3.0",
-            self.colors[4]  # Red
+        self.screen.blit(
+            self._text("HEGEMONY 3.0", self.colors[4], bold=True), (10, 10)
         )
-        self.font.render_to(
-            self.screen,
-            (400, 10),
-            "Copyright: Akos Ivanyi (21.07.2003)",
-            self.colors[7]  # Light Gray
+        self.screen.blit(
+            self._text("Copyright: Akos Ivanyi (21.07.2003)", self.colors[7]),
+            (400, 10)
         )
         pygame.draw.line(
             self.screen,
@@ -135,46 +317,79 @@ class Interface:
             (self.screen_width, 35)
         )
     
+    def _dot_surf(self, color_idx: int) -> pygame.Surface:
+        """Owner indicator dot, rendered once per color"""
+        surf = self._dot_surfs.get(color_idx)
+        if surf is None:
+            surf = pygame.Surface((5, 5)).convert()
+            surf.fill(self.colors[color_idx])
+            self._dot_surfs[color_idx] = surf
+        return surf
+
+    def _select_surf(self, cell_size: int) -> pygame.Surface:
+        """Selection outline, rendered once per cell size"""
+        surf = self._select_surfs.get(cell_size)
+        if surf is None:
+            surf = pygame.Surface(
+                (cell_size, cell_size), pygame.SRCALPHA
+            ).convert_alpha()
+            pygame.draw.rect(
+                surf, self.colors[15], (0, 0, cell_size, cell_size), 1
+            )
+            self._select_surfs[cell_size] = surf
+        return surf
+
     def draw_map(
         self,
-        terrain_map: List[List[int]],
-        owner_map: List[List[int]],
-        owner_colors: List[int],
-        terrain_colors: List[int],
+        terrain_map: np.ndarray,
+        owner_map: np.ndarray,
+        owner_colors: Tuple[int, ...],
+        terrain_colors: Tuple[int, ...],
         cell_size: int = 20,
         offset_x: int = 130,
         offset_y: int = 80
     ):
-        """Draw the game map"""
-        for y in range(len(terrain_map)):
-            for x in range(len(terrain_map[0])):
-                # Draw cell border
-                rect = pygame.Rect(
-                    offset_x + x * cell_size,
-                    offset_y + y * cell_size,
-                    cell_size,
-                    cell_size
-                )
-                pygame.draw.rect(self.screen, self.colors[0], rect, 1)
-                
-                # Fill with terrain color
-                inner_rect = rect.inflate(-2, -2)
-                terrain_color = self.colors[terrain_colors[terrain_map[y][x]]]
-                pygame.draw.rect(self.screen, terrain_color, inner_rect)
-                
-                # Draw owner indicator
-                if owner_map[y][x] != 0:
-                    owner_rect = pygame.Rect(
-                        offset_x + x * cell_size + cell_size - 5,
-                        offset_y + y * cell_size + cell_size - 5,
-                        5, 5
-                    )
-                    owner_color = self.colors[owner_colors[owner_map[y][x]]]
-                    pygame.draw.rect(self.screen, owner_color, owner_rect)
-                
-                # Highlight selected cell
-                if x == self.state.selected_x and y == self.state.selected_y:
-                    pygame.draw.rect(self.screen, self.colors[15], rect, 1)
+        """Draw the game map
+
+        The terrain layer is built as one RGB array — palette gather,
+        pixel upsample, border slices — and written into a persistent
+        surface in a single surfarray call; owner dots and the
+        selection outline go on top as one batched blits() call.
+        """
+        # Gather cell colors and upsample to pixels
+        rgb = self._palette[
+            np.asarray(terrain_colors, dtype=np.intp)[terrain_map]
+        ]
+        rgb = rgb.repeat(cell_size, 0).repeat(cell_size, 1)
+
+        # Black out the 1-px cell borders with strided slices
+        rgb[::cell_size] = 0
+        rgb[cell_size - 1::cell_size] = 0
+        rgb[:, ::cell_size] = 0
+        rgb[:, cell_size - 1::cell_size] = 0
+
+        size = (rgb.shape[1], rgb.shape[0])
+        map_surf = self._map_surfs.get(size)
+        if map_surf is None:
+            map_surf = pygame.Surface(size).convert()
+            self._map_surfs[size] = map_surf
+        pygame.surfarray.blit_array(map_surf, rgb.swapaxes(0, 1))
+        self.screen.blit(map_surf, (offset_x, offset_y))
+
+        # Overlay owner dots and the selection highlight in one batch
+        dot = self._dot_surf
+        blit_list = [
+            (dot(owner_colors[owner_map[y, x]]),
+             (offset_x + x * cell_size + cell_size - 5,
+              offset_y + y * cell_size + cell_size - 5))
+            for y, x in np.argwhere(owner_map != 0)
+        ]
+        blit_list.append((
+            self._select_surf(cell_size),
+            (offset_x + self.state.selected_x * cell_size,
+             offset_y + self.state.selected_y * cell_size)
+        ))
+        self.screen.blits(blit_list, doreturn=False)
     
     def draw_info_panel(
         self,
@@ -184,337 +399,250 @@ class Interface:
         territory_info: Dict
     ):
         """Draw the information panel"""
-        x = 455
-        y = 80
-        
-        # Draw panel background
-        pygame.draw.rect(
-            self.screen,
-            self.colors[0],
-            (x, y, 185, 260)
+        player = self.current_player
+        key = (
+            player_name, turn, money,
+            tuple(territory_info.items()),
+            self.state.selected_x, self.state.selected_y,
+            player and (player.sea_army + player.sea_moved),
+            player and player.navy,
         )
-        
+        # Reblit last frame's composite when nothing on the panel changed
+        if key == self._panel_key:
+            self.screen.blit(self._panel_surf, (455, 80))
+            return
+
+        panel = pygame.Surface((185, 260)).convert()
+        panel.fill(self.colors[0])
+        y = 0
+
         # Draw player info
-        self.font.render_to(
-            self.screen,
-            (x + 5, y + 5),
-            f"{player_name}'s turn: {turn}",
-            self.colors[7]
-        )
-        
+        panel.blit(self._text(f"{player_name}'s turn: {turn}", self.colors[7]), (5, 5))
+
         # Draw territory info
         y += 30
-        self.font.render_to(
-            self.screen,
-            (x + 5, y),
-            f"Location: {self.state.selected_x}, {self.state.selected_y}",
-            self.colors[7]
+        panel.blit(
+            self._text(
+                f"Location: {self.state.selected_x}, {self.state.selected_y}",
+                self.colors[7]
+            ),
+            (5, y)
         )
-        
-        for key, value in territory_info.items():
+
+        for info_key, value in territory_info.items():
             y += 20
-            self.font.render_to(
-                self.screen,
-                (x + 5, y),
-                f"{key}: {value}",
-                self.colors[7]
-            )
-        
+            panel.blit(self._text(f"{info_key}: {value}", self.colors[7]), (5, y))
+
         # Draw money and naval info
-        self.font.render_to(
-            self.screen,
-            (x + 5, y + 40),
-            f"Gold: {money}",
-            self.colors[14]  # Yellow
-        )
-        
+        panel.blit(self._text(f"Gold: {money}", self.colors[14]), (5, y + 40))
+
         # Draw naval information
-        if self.current_player:
+        if player:
             y += 20
-            self.font.render_to(
-                self.screen,
-                (x + 5, y + 40),
-                f"Embarked Units: {self.current_player.sea_army + self.current_player.sea_moved}/{self.current_player.navy}",
-                self.colors[7]  # Light Gray
+            panel.blit(
+                self._text(
+                    f"Embarked Units: {player.sea_army + player.sea_moved}/{player.navy}",
+                    self.colors[7]
+                ),
+                (5, y + 40)
             )
+
+        self._panel_key = key
+        self._panel_surf = panel
+        self.screen.blit(panel, (455, 80))
     
     def draw_menu(self):
-        """Draw the main menu"""
-        x = 10
-        y = 80
-        
-        for section_name, items in self.main_menu:
-            self.font.render_to(
-                self.screen,
-                (x, y),
-                section_name,
-                self.colors[7]
-            )
-            y += 20
-            
-            for item_name, key in items:
-                if isinstance(key, list):
-                    # Submenu
-                    for sub_name, sub_key in key:
-                        self.font.render_to(
-                            self.screen,
-                            (x + 20, y),
-                            f"{sub_name} ({sub_key})",
-                            self.colors[7]
-                        )
-                        y += 15
-                else:
-                    self.font.render_to(
-                        self.screen,
-                        (x + 10, y),
-                        f"{item_name} ({key})",
-                        self.colors[7]
-                    )
-                    y += 15
-            y += 10
+        """Draw the pre-rendered main menu"""
+        self.screen.blit(self._menu_surf, (10, 80))
     
     def draw_message(self):
         """Draw the current message"""
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 30),
-            self.state.message,
-            self.colors[7]
+        self.screen.blit(
+            self._text(self.state.message, self.colors[7]),
+            (10, self.screen_height - 30)
         )
     
     def draw_unit_size(self):
         """Draw the current military unit size"""
-        sizes = [1, 2, 5, 10, 20, 50, 100]
         self.font.render_to(
             self.screen,
             (10, self.screen_height - 50),
-            f"Unit size: {sizes[self.state.code - 1]}",
+            f"Unit size: {_UNIT_SIZES[self.state.code - 1]}",
             self.colors[7]
         )
     
     def handle_input(self, event: pygame.event.Event) -> Optional[str]:
         """Handle input events and return command if any"""
-        if event.type == pygame.KEYDOWN:
-            # Handle ESC key for all screens
-            if event.key == pygame.K_ESCAPE:
-                if self.state.help_content:
-                    self.state.help_content = None
-                    self.state.help_scroll = 0
-                    return None
-                elif self.state.active_screen:
-                    self.state.active_screen = None
-                    return None
-            
-            # Handle treasury screen controls
-            if self.state.active_screen == "treasury":
-                if event.key == pygame.K_LEFT:
-                    return "decrease_tax"
-                elif event.key == pygame.K_RIGHT:
-                    return "increase_tax"
-                return None
-            
-            # Handle science screen controls
-            elif self.state.active_screen == "science":
-                # Science spending (1-6)
-                if event.unicode in "123456":
-                    return f"science {event.unicode}"
-                # Spy placement (player numbers)
-                elif (event.unicode.isdigit() and 
-                      int(event.unicode) in self.all_players and 
-                      int(event.unicode) != self.current_player.id):
-                    target_id = int(event.unicode)
-                    target = self.all_players[target_id]
-                    
-                    # Check if already spying
-                    if not self.current_player.science.spied_empires.get(target_id, False):
-                        spy_cost = self.current_player.get_spy_cost(target)
-                        if self.current_player.money >= spy_cost:
-                            return f"spy {target_id}"
-                        else:
-                            self.state.message = "Not enough gold to place spy"
-                    else:
-                        self.state.message = "Already spying on this empire"
+        if event.type != pygame.KEYDOWN:
+            return None
+
+        # Handle ESC key for all screens
+        if event.key == pygame.K_ESCAPE:
+            if self.state.help_content:
+                self.state.help_content = None
+                self.state.help_scroll = 0
                 return None
-            
-            # Handle diplomacy screen controls
-            elif self.state.active_screen == "diplomacy":
-                # Check for number keys 1-9 for diplomatic actions
-                if event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, 
-                               pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9]:
-                    try:
-                        target_id = int(event.unicode)
-                        if target_id != self.current_player.id:  # Can't interact with yourself
-                            return f"set_negative_{target_id}"
-                    except ValueError:
-                        # If the unicode character isn't a valid number, ignore it
-                        pass
-                # Check for direct key presses for improving relations
-                elif event.unicode in ['o', 'p', '[', ']', 'l', "'", ',', '.', '/']:
-                    # Map each key to a specific nation
-                    key_to_nation = {
-                        'o': 1,
-                        'p': 2,
-                        '[': 3,
-                        ']': 4,
-                        'l': 5,
-                            "'": 6,
-                            ',': 7,
-                            '.': 8,
-                            '/': 9
-                        }
-                    target_id = key_to_nation.get(event.unicode)
-                    if target_id and target_id != self.current_player.id:  # Can't interact with yourself
-                        # Check if relations have already been changed this turn
-                        if not self.current_player.relations_changed.get(target_id, False):
-                            return f"improve_relations_{target_id}"
-                return None
-            
-            # If a game screen is active, only handle specific keys
-            if self.state.active_screen:
+            elif self.state.active_screen:
+                self.state.active_screen = None
                 return None
+
+        # Dispatch to the active screen's handler, if it has one
+        handler = self._screen_handlers.get(self.state.active_screen)
+        if handler is not None:
+            return handler(event)
+
+        # If a game screen is active, only handle specific keys
+        if self.state.active_screen:
+            return None
+
+        return self._handle_game_key(event)
+
+    def _handle_treasury_key(self, event: pygame.event.Event) -> Optional[str]:
+        """Treasury screen controls"""
+        if event.key == pygame.K_LEFT:
+            return "decrease_tax"
+        elif event.key == pygame.K_RIGHT:
+            return "increase_tax"
+        return None
+
+    def _handle_science_key(self, event: pygame.event.Event) -> Optional[str]:
+        """Science screen controls"""
+        # Science spending (1-6)
+        if event.unicode in "123456":
+            return f"science {event.unicode}"
+        # Spy placement (player numbers)
+        elif (event.unicode.isdigit() and 
+              int(event.unicode) in self.all_players and 
+              int(event.unicode) != self.current_player.id):
+            target_id = int(event.unicode)
+            target = self.all_players[target_id]
             
-            # Movement
-            mods = pygame.key.get_mods()
+            # Check if already spying
+            if not self.current_player.science.spied_empires.get(target_id, False):
+                spy_cost = self.current_player.get_spy_cost(target)
+                if self.current_player.money >= spy_cost:
+                    return f"spy {target_id}"
+                else:
+                    self.state.message = "Not enough gold to place spy"
+            else:
+                self.state.message = "Already spying on this empire"
+        return None
+
+    def _handle_diplomacy_key(self, event: pygame.event.Event) -> Optional[str]:
+        """Diplomacy screen controls"""
+        # Check for number keys 1-9 for diplomatic actions
+        if event.key in self._DIGIT_KEYS:
+            try:
+                target_id = int(event.unicode)
+                if target_id != self.current_player.id:  # Can't interact with yourself
+                    return f"set_negative_{target_id}"
+            except ValueError:
+                # If the unicode character isn't a valid number, ignore it
+                pass
+        # Check for direct key presses for improving relations
+        elif event.unicode in _KEY_TO_NATION:
+            target_id = _KEY_TO_NATION.get(event.unicode)
+            if target_id and target_id != self.current_player.id:  # Can't interact with yourself
+                # Check if relations have already been changed this turn
+                if not self.current_player.relations_changed.get(target_id, False):
+                    return f"improve_relations_{target_id}"
+        return None
+
+    def _handle_game_key(self, event: pygame.event.Event) -> Optional[str]:
+        """Map-view controls: movement, unit size, help scrolling and
+        the menu command tables"""
+        # Movement
+        mods = pygame.key.get_mods()
+        if event.key == pygame.K_UP:
+            if mods & pygame.KMOD_SHIFT:
+                return "move_up"
+            self.state.selected_y = max(0, self.state.selected_y - 1)
+        elif event.key == pygame.K_DOWN:
+            if mods & pygame.KMOD_SHIFT:
+                return "move_down"
+            self.state.selected_y = min(_MAX_COORD, self.state.selected_y + 1)
+        elif event.key == pygame.K_LEFT:
+            if mods & pygame.KMOD_SHIFT:
+                return "move_left"
+            self.state.selected_x = max(0, self.state.selected_x - 1)
+        elif event.key == pygame.K_RIGHT:
+            if mods & pygame.KMOD_SHIFT:
+                return "move_right"
+            self.state.selected_x = min(_MAX_COORD, self.state.selected_x + 1)
+
+        # Unit size
+        elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):  # Handle =, +, and numpad +
+            if self.state.code < 7:
+                self.state.code += 1
+                self.state.message = f"Unit size increased to {_UNIT_SIZES[self.state.code - 1]}"
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):  # Handle -, and numpad -
+            if self.state.code > 1:
+                self.state.code -= 1
+                self.state.message = f"Unit size decreased to {_UNIT_SIZES[self.state.code - 1]}"
+
+        # Help screen controls
+        if self.state.help_content:
             if event.key == pygame.K_UP:
-                if mods & pygame.KMOD_SHIFT:
-                    return "move_up"
-                elif self.state.selected_y > 0:
-                    self.state.selected_y -= 1
+                if self.state.help_scroll > 0:
+                    self.state.help_scroll -= 1
+                return None
             elif event.key == pygame.K_DOWN:
-                if mods & pygame.KMOD_SHIFT:
-                    return "move_down"
-                elif self.state.selected_y < 14:
-                    self.state.selected_y += 1
-            elif event.key == pygame.K_LEFT:
-                if mods & pygame.KMOD_SHIFT:
-                    return "move_left"
-                elif self.state.selected_x > 0:
-                    self.state.selected_x -= 1
-            elif event.key == pygame.K_RIGHT:
-                if mods & pygame.KMOD_SHIFT:
-                    return "move_right"
-                elif self.state.selected_x < 14:
-                    self.state.selected_x += 1
-            
-            # Unit size
-            elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):  # Handle =, +, and numpad +
-                if self.state.code < 7:
-                    self.state.code += 1
-                    sizes = [1, 2, 5, 10, 20, 50, 100]
-                    self.state.message = f"Unit size increased to {sizes[self.state.code - 1]}"
-            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):  # Handle -, and numpad -
-                if self.state.code > 1:
-                    self.state.code -= 1
-                    sizes = [1, 2, 5, 10, 20, 50, 100]
-                    self.state.message = f"Unit size decreased to {sizes[self.state.code - 1]}"
-            
-            # Help screen controls
-            if self.state.help_content:
-                if event.key == pygame.K_UP:
-                    if self.state.help_scroll > 0:
-                        self.state.help_scroll -= 1
-                    return None
-                elif event.key == pygame.K_DOWN:
-                    visible_lines = (self.screen_height - 70) // 20
-                    if self.state.help_scroll < len(self.state.help_content) - visible_lines:
-                        self.state.help_scroll += 1
-                    return None
-                return None  # Ignore other keys when help screen is shown
-            
-            # Menu commands
-            elif event.key == pygame.K_i:
-                return "info"
-            elif event.key == pygame.K_t:
-                return "treasury"
-            elif event.key == pygame.K_s:
-                return "science"
-            elif event.key == pygame.K_d:
-                return "diplomacy"
-            # Handle sell commands first (capital letters)
-            elif mods & pygame.KMOD_SHIFT:
-                if event.key == pygame.K_m:  # Capital M
-                    return "sell_mill"
-                elif event.key == pygame.K_a:  # Capital A
-                    return "sell_army"
-                elif event.key == pygame.K_n:  # Capital N
-                    return "sell_navy"
-                elif event.key == pygame.K_f:  # Capital F
-                    return "sell_fort"
-                elif event.key == pygame.K_c:  # Capital C
-                    return "sell_church"
-                elif event.key == pygame.K_u:  # Capital U
-                    return "sell_university"
-            # Then handle build commands (lowercase letters)
-            elif event.key == pygame.K_f:
-                return "build_fort"
-            elif event.key == pygame.K_c:
-                return "build_church"
-            elif event.key == pygame.K_u:
-                return "build_university"
-            elif event.key == pygame.K_m:
-                return "build_mill"
-            elif event.key == pygame.K_a:
-                return "build_army"
-            elif event.key == pygame.K_n:
-                return "build_navy"
-            elif event.key == pygame.K_b:
-                return "embark"
-            elif event.key == pygame.K_e:
-                return "end_turn"
-            elif event.key == pygame.K_g:
-                return "save_game"
-            elif event.key == pygame.K_h:
-                return "help"
-            elif event.key == pygame.K_q:
-                return "quit"
-        
-        return None
-    
+                visible_lines = (self.screen_height - 70) // 20
+                if self.state.help_scroll < len(self.state.help_content) - visible_lines:
+                    self.state.help_scroll += 1
+                return None
+            return None  # Ignore other keys when help screen is shown
+
+        # Menu commands; shift selects the sell bindings
+        table = self._SHIFT_CMDS if mods & pygame.KMOD_SHIFT else self._LOWER_CMDS
+        return table.get(event.key)
+
     def update(self):
         """Update the display"""
         pygame.display.flip()
     
-    def show_motto(self) -> bool:
+    def show_motto(self, events: List[pygame.event.Event]) -> bool:
         """Show motto screen and return True if a key was pressed"""
         self.screen.fill(self.colors[0])  # Black background
-        
-        # Draw motto with word wrapping
-        words = self.motto.split()
-        lines = []
-        current_line = []
-        for word in words:
-            current_line.append(word)
-            text = ' '.join(current_line)
-            if self.font.get_rect(text)[2] > self.screen_width - 100:  # Leave 50px margin on each side
-                current_line.pop()
+
+        # Word-wrap the motto once; each word is measured a single time and
+        # line widths accumulate instead of re-measuring joined strings
+        if self._motto_lines is None:
+            space_w = self.font.get_rect(" ")[2]
+            lines = []
+            current_line = []
+            line_w = 0
+            max_w = self.screen_width - 100  # Leave 50px margin on each side
+            for word in self.motto.split():
+                word_w = self.font.get_rect(word)[2]
+                new_w = line_w + word_w if not current_line else line_w + space_w + word_w
+                if new_w > max_w and current_line:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    line_w = word_w
+                else:
+                    current_line.append(word)
+                    line_w = new_w
+            if current_line:
                 lines.append(' '.join(current_line))
-                current_line = [word]
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        total_height = len(lines) * 20  # Calculate total height of text
+            self._motto_lines = lines
+
+        total_height = len(self._motto_lines) * 20  # Calculate total height of text
         y = (self.screen_height - total_height) // 2  # Center vertically
-        
-        for line in lines:
-            text_rect = self.font.get_rect(line)
-            x = (self.screen_width - text_rect[2]) // 2  # Center horizontally
-            self.font.render_to(
-                self.screen,
-                (x, y),
-                line,
-                self.colors[15]  # White
-            )
+
+        for line in self._motto_lines:
+            surf = self._text(line, self.colors[15])  # White
+            x = (self.screen_width - surf.get_width()) // 2  # Center horizontally
+            self.screen.blit(surf, (x, y))
             y += 20  # Line spacing
         
-        self.font.render_to(
-            self.screen,
-            (self.screen_width // 2 - 100, self.screen_height - 50),
-            "Press any key to continue",
-            self.colors[15]  # White
+        self.screen.blit(
+            self._text("Press any key to continue", self.colors[15]),
+            (self.screen_width // 2 - 100, self.screen_height - 50)
         )
         pygame.display.flip()
-        
-        for event in pygame.event.get():
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return True
             if event.type == pygame.KEYDOWN:
@@ -522,20 +650,18 @@ class Interface:
                 self.show_title_screen = True
                 return True
         return False
-        
-    def show_title(self) -> bool:
+
+    def show_title(self, events: List[pygame.event.Event]) -> bool:
         """Show title screen and return True if a key was pressed"""
         self.screen.blit(self.title_image, (0, 0))
         
-        self.font.render_to(
-            self.screen,
-            (self.screen_width // 2 - 100, self.screen_height - 50),
-            "Press any key to start",
-            self.colors[15]  # White
+        self.screen.blit(
+            self._text("Press any key to start", self.colors[15]),
+            (self.screen_width // 2 - 100, self.screen_height - 50)
         )
         pygame.display.flip()
-        
-        for event in pygame.event.get():
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return True
             if event.type == pygame.KEYDOWN:
@@ -543,42 +669,28 @@ class Interface:
                 self.show_country_select = True
                 return True
         return False
-        
-    def show_country_selection(self) -> Optional[int]:
+
+    def show_country_selection(self, events: List[pygame.event.Event]) -> Optional[int]:
         """Show country selection screen and return selected country index if confirmed"""
         self.screen.fill(self.colors[0])  # Black background
-        
+
         # Draw title
-        self.title_font.render_to(
-            self.screen,
-            (10, 10),
-            "Select Your Country",
-            self.colors[15]  # White
-        )
-        
-        # Draw country list
+        self.screen.blit(self._country_title_surf, (10, 10))
+
+        # Draw country list; yellow variant if selected
         y = 50
-        for i, country in enumerate(self.countries):
-            color = self.colors[14] if i == self.selected_country else self.colors[7]  # Yellow if selected
-            self.font.render_to(
-                self.screen,
-                (50, y),
-                country,
-                color
-            )
+        for i, surfs in enumerate(self._country_surfs):
+            self.screen.blit(surfs[0 if i == self.selected_country else 1], (50, y))
             y += 30
-            
+
         # Draw instructions
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 50),
-            "Use Up/Down arrows to select, Enter to confirm",
-            self.colors[14]  # Yellow
+        self.screen.blit(
+            self._country_instr_surf, (10, self.screen_height - 50)
         )
-        
+
         pygame.display.flip()
-        
-        for event in pygame.event.get():
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return -1
             if event.type == pygame.KEYDOWN:
@@ -607,35 +719,43 @@ class Interface:
             self.colors[15]  # White
         )
         
+        # Classify separator lines (lines with only = characters) once
+        # per help file instead of per frame
+        if self.state.help_content is not self._help_key:
+            self._help_key = self.state.help_content
+            self._help_lines = [
+                line for line in self.state.help_content
+                if not all(c == '=' for c in line.strip())
+            ]
+
         # Draw content
         y = 50
         line_height = 20
         visible_lines = (self.screen_height - 70) // line_height  # Leave space for title and footer
-        
-        for i in range(self.state.help_scroll, min(len(self.state.help_content), self.state.help_scroll + visible_lines)):
-            line = self.state.help_content[i]
-            # Skip separator lines (lines with only = characters)
-            if not all(c == '=' for c in line.strip()):
-                self.font.render_to(
-                    self.screen,
-                    (10, y),
-                    line,
-                    self.colors[7]  # Light Gray
-                )
-                y += line_height
+
+        scroll = self.state.help_scroll
+        for line in self._help_lines[scroll:scroll + visible_lines]:
+            self.screen.blit(self._text(line, self.colors[7]), (10, y))  # Light Gray
+            y += line_height
         
         # Draw scroll indicator
         if len(self.state.help_content) > visible_lines:
-            self.font.render_to(
-                self.screen,
-                (10, self.screen_height - 20),
-                "Use Up/Down arrows to scroll, ESC to return",
-                self.colors[14]  # Yellow
+            self.screen.blit(
+                self._text(
+                    "Use Up/Down arrows to scroll, ESC to return",
+                    self.colors[14]
+                ),
+                (10, self.screen_height - 20)
             )
 
     def draw_information_screen(self, player):
         """Draw empire information screen"""
-        self.screen.fill(self.colors[0])
+        # Bound locally: these run dozens of times below
+        render = self.font.render_to
+        screen = self.screen
+        c7 = self.colors[7]
+        c12 = self.colors[12]
+        screen.fill(self.colors[0])
         
         self.title_font.render_to(
             self.screen,
@@ -646,29 +766,29 @@ class Interface:
         
         # Basic info
         y = 50
-        self.font.render_to(self.screen, (10, y), f"Empire: {player.name}", self.colors[7])
+        render(screen, (10, y), f"Empire: {player.name}", c7)
         y += 20
-        self.font.render_to(self.screen, (10, y), f"Trust Level: {player.trust:.1f}", self.colors[7])
+        render(screen, (10, y), f"Trust Level: {player.trust:.1f}", c7)
         y += 20
-        self.font.render_to(self.screen, (10, y), f"Tax Rate: {player.tax_rate:.1f}%", self.colors[7])
+        render(screen, (10, y), f"Tax Rate: {player.tax_rate:.1f}%", c7)
         y += 20
-        self.font.render_to(self.screen, (10, y), f"Morale: {player.morale:.2f}", self.colors[7])
+        render(screen, (10, y), f"Morale: {player.morale:.2f}", c7)
         
         # Population breakdown
         y += 30
         self.title_font.render_to(self.screen, (10, y), "Population", self.colors[15])
         y += 25
-        self.font.render_to(self.screen, (20, y), f"Total: {player.population}", self.colors[7])
+        render(screen, (20, y), f"Total: {player.population}", c7)
         y += 20
-        self.font.render_to(self.screen, (20, y), f"Peasants: {player.peasants}", self.colors[7])
+        render(screen, (20, y), f"Peasants: {player.peasants}", c7)
         y += 20
-        self.font.render_to(self.screen, (20, y), f"Fishers: {player.fishers}", self.colors[7])
+        render(screen, (20, y), f"Fishers: {player.fishers}", c7)
         y += 20
-        self.font.render_to(self.screen, (20, y), f"Workers: {player.workers}", self.colors[7])
+        render(screen, (20, y), f"Workers: {player.workers}", c7)
         y += 20
-        self.font.render_to(self.screen, (20, y), f"Merchants: {player.merchants}", self.colors[7])
+        render(screen, (20, y), f"Merchants: {player.merchants}", c7)
         y += 20
-        self.font.render_to(self.screen, (20, y), f"Unemployed: {player.unemployed}", self.colors[7])
+        render(screen, (20, y), f"Unemployed: {player.unemployed}", c7)
         
         # Income breakdown
         x = 300
@@ -676,11 +796,13 @@ class Interface:
         self.title_font.render_to(self.screen, (x, y), "Income", self.colors[15])
         y += 25
         
-        # Calculate income from each source
-        peasant_income = int(player.peasants * (player.tax_rate/100) * player.morale * player.science.agriculture * 4)
-        fisher_income = int(player.fishers * (player.tax_rate/100) * player.morale * player.science.sailing * 4)
-        worker_income = int(player.workers * (player.tax_rate/100) * player.morale * player.science.industry * 8)
-        merchant_income = int(player.merchants * (player.tax_rate/100) * player.morale * player.science.trade * 16)
+        # Calculate income from each source; tax and morale factor out
+        tm = (player.tax_rate / 100) * player.morale
+        sci = player.science
+        peasant_income = int(player.peasants * tm * sci.agriculture * 4)
+        fisher_income = int(player.fishers * tm * sci.sailing * 4)
+        worker_income = int(player.workers * tm * sci.industry * 8)
+        merchant_income = int(player.merchants * tm * sci.trade * 16)
         
         # Interest income/expense
         interest = 0
@@ -689,16 +811,16 @@ class Interface:
         else:
             interest = -int(abs(player.money) * 0.12)  # 12% interest on debt
         
-        self.font.render_to(self.screen, (x + 10, y), f"From Peasants: {peasant_income}", self.colors[7])
+        render(screen, (x + 10, y), f"From Peasants: {peasant_income}", c7)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"From Fishers: {fisher_income}", self.colors[7])
+        render(screen, (x + 10, y), f"From Fishers: {fisher_income}", c7)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"From Workers: {worker_income}", self.colors[7])
+        render(screen, (x + 10, y), f"From Workers: {worker_income}", c7)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"From Merchants: {merchant_income}", self.colors[7])
+        render(screen, (x + 10, y), f"From Merchants: {merchant_income}", c7)
         y += 20
         color = self.colors[10] if interest > 0 else self.colors[12]  # Green if positive, red if negative
-        self.font.render_to(self.screen, (x + 10, y), f"Interest: {interest}", color)
+        render(screen, (x + 10, y), f"Interest: {interest}", color)
         
         # Expenses
         y += 30
@@ -706,24 +828,24 @@ class Interface:
         y += 25
         
         # Calculate maintenance costs
-        mill_cost = int(player.mills * player.science.industry * 20)
+        mill_cost = int(player.mills * sci.industry * 20)
         fort_cost = int(player.forts * 30)
         church_cost = int(player.churches * 3)
         university_cost = int(player.universities * 25)
         navy_cost = int(player.navy * 20)
         army_cost = int(player.soldiers * 30)
         
-        self.font.render_to(self.screen, (x + 10, y), f"Mills: -{mill_cost}", self.colors[12])
+        render(screen, (x + 10, y), f"Mills: -{mill_cost}", c12)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"Forts: -{fort_cost}", self.colors[12])
+        render(screen, (x + 10, y), f"Forts: -{fort_cost}", c12)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"Churches: -{church_cost}", self.colors[12])
+        render(screen, (x + 10, y), f"Churches: -{church_cost}", c12)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"Universities: -{university_cost}", self.colors[12])
+        render(screen, (x + 10, y), f"Universities: -{university_cost}", c12)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"Navy: -{navy_cost}", self.colors[12])
+        render(screen, (x + 10, y), f"Navy: -{navy_cost}", c12)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"Army: -{army_cost}", self.colors[12])
+        render(screen, (x + 10, y), f"Army: -{army_cost}", c12)
         
         # Total income
         y += 30
@@ -737,20 +859,40 @@ class Interface:
         y = 50
         self.title_font.render_to(self.screen, (x, y), "Military", self.colors[15])
         y += 25
-        self.font.render_to(self.screen, (x + 10, y), f"Naval Capacity: {player.navy}", self.colors[7])
+        render(screen, (x + 10, y), f"Naval Capacity: {player.navy}", c7)
         y += 20
-        self.font.render_to(self.screen, (x + 10, y), f"Embarked Units: {player.sea_army + player.sea_moved}", self.colors[7])
+        render(screen, (x + 10, y), f"Embarked Units: {player.sea_army + player.sea_moved}", c7)
         
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 20),
-            "Press ESC to return",
-            self.colors[14]
+        self.screen.blit(
+            self._text("Press ESC to return", self.colors[14]),
+            (10, self.screen_height - 20)
         )
 
+    def _projected_income(self, player) -> int:
+        """Income projection memoized on the values the formula uses"""
+        sci = player.science
+        key = (
+            player.peasants, player.fishers, player.workers, player.merchants,
+            player.tax_rate, player.morale, player.money,
+            player.mills, player.forts, player.churches, player.universities,
+            player.navy, player.soldiers,
+            sci.agriculture, sci.sailing, sci.industry, sci.trade,
+        )
+        cached = self._income_cache.get(player.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        income = self._pm.calculate_income(player)
+        self._income_cache[player.id] = (key, income)
+        return income
+
     def draw_treasury_screen(self, player):
         """Draw treasury management screen"""
-        self.screen.fill(self.colors[0])
+        # Bound locally: these run for every nation row below
+        render = self.font.render_to
+        screen = self.screen
+        c7 = self.colors[7]
+        c14 = self.colors[14]
+        screen.fill(self.colors[0])
         
         self.title_font.render_to(
             self.screen,
@@ -763,18 +905,16 @@ class Interface:
         y = 50
         self.title_font.render_to(self.screen, (10, y), "Your Empire", self.colors[15])
         y += 25
-        self.font.render_to(self.screen, (10, y), f"Current Gold: {player.money}", self.colors[14])
+        render(screen, (10, y), f"Current Gold: {player.money}", c14)
         y += 20
-        self.font.render_to(self.screen, (10, y), f"Tax Rate: {player.tax_rate:.1f}%", self.colors[7])
+        render(screen, (10, y), f"Tax Rate: {player.tax_rate:.1f}%", c7)
         y += 20
-        self.font.render_to(self.screen, (10, y), "(Use Left/Right arrows to adjust)", self.colors[7])
+        render(screen, (10, y), "(Use Left/Right arrows to adjust)", c7)
         
         # Calculate and show projected income
-        from player import PlayerManager
-        pm = PlayerManager()
-        projected_income = pm.calculate_income(player)
+        projected_income = self._projected_income(player)
         y += 20
-        self.font.render_to(self.screen, (10, y), f"Projected Income: {projected_income}", self.colors[14])
+        render(screen, (10, y), f"Projected Income: {projected_income}", c14)
         
         # Other nations' info
         y = 50
@@ -782,15 +922,6 @@ class Interface:
         self.title_font.render_to(self.screen, (x, y), "Other Nations", self.colors[15])
         y += 25
         
-        # Diplomatic status names and info levels
-        status_names = {
-            1: "War",
-            2: "Hostile",
-            3: "Neutral",
-            4: "Friendly",
-            5: "Allied"
-        }
-        
         for other_player in self.all_players.values():
             if other_player.id != player.id:
                 # Get diplomatic status
@@ -800,43 +931,44 @@ class Interface:
                 self.font.render_to(
                     self.screen,
                     (x, y),
-                    f"{other_player.name} ({status_names[status]})",
+                    f"{other_player.name} ({_STATUS_NAMES[status]})",
                     self.colors[other_player.id]
                 )
                 y += 20
                 
                 # Show info based on diplomatic status
                 if status >= 5:  # Allied - show everything
-                    self.font.render_to(self.screen, (x + 20, y), f"Gold: {other_player.money}", self.colors[7])
+                    render(screen, (x + 20, y), f"Gold: {other_player.money}", c7)
                     y += 20
-                    self.font.render_to(self.screen, (x + 20, y), f"Tax Rate: {other_player.tax_rate:.1f}%", self.colors[7])
+                    render(screen, (x + 20, y), f"Tax Rate: {other_player.tax_rate:.1f}%", c7)
                     y += 20
-                    income = pm.calculate_income(other_player)
-                    self.font.render_to(self.screen, (x + 20, y), f"Income: {income}", self.colors[7])
+                    income = self._projected_income(other_player)
+                    render(screen, (x + 20, y), f"Income: {income}", c7)
                     y += 20
-                    self.font.render_to(self.screen, (x + 20, y), f"Population: {other_player.population}", self.colors[7])
+                    render(screen, (x + 20, y), f"Population: {other_player.population}", c7)
                     y += 20
                 elif status == 4:  # Friendly - show most info
-                    self.font.render_to(self.screen, (x + 20, y), f"Gold: {other_player.money}", self.colors[7])
+                    render(screen, (x + 20, y), f"Gold: {other_player.money}", c7)
                     y += 20
-                    self.font.render_to(self.screen, (x + 20, y), f"Tax Rate: {other_player.tax_rate:.1f}%", self.colors[7])
+                    render(screen, (x + 20, y), f"Tax Rate: {other_player.tax_rate:.1f}%", c7)
                     y += 20
-                    self.font.render_to(self.screen, (x + 20, y), f"Population: {other_player.population}", self.colors[7])
+                    render(screen, (x + 20, y), f"Population: {other_player.population}", c7)
                     y += 20
                 elif status == 3:  # Neutral - show basic info
-                    self.font.render_to(self.screen, (x + 20, y), f"Population: {other_player.population}", self.colors[7])
+                    render(screen, (x + 20, y), f"Population: {other_player.population}", c7)
                     y += 20
                 else:  # Hostile/War - show no info
-                    self.font.render_to(self.screen, (x + 20, y), "No information available", self.colors[8])
+                    render(screen, (x + 20, y), "No information available", self.colors[8])
                     y += 20
                 
                 y += 10  # Space between nations
         
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 20),
-            "Use Left/Right arrows to adjust tax rate, ESC to return",
-            self.colors[14]
+        self.screen.blit(
+            self._text(
+                "Use Left/Right arrows to adjust tax rate, ESC to return",
+                self.colors[14]
+            ),
+            (10, self.screen_height - 20)
         )
 
     def draw_science_screen(self, player):
@@ -850,16 +982,6 @@ class Interface:
             self.colors[15]
         )
         
-        # Science branch names and keys
-        science_branches = {
-            1: ("Agriculture", "1"),
-            2: ("Industry", "2"),
-            3: ("Trade", "3"),
-            4: ("Sailing", "4"),
-            5: ("Military", "5"),
-            6: ("Medicine", "6")
-        }
-        
         # Draw current gold
         self.font.render_to(
             self.screen,
@@ -868,29 +990,42 @@ class Interface:
             self.colors[14]
         )
         
+        # Max spendable amounts and branch labels, recomputed only when
+        # gold or a science level actually changes; the twelve label
+        # lines are composed into one surface so the per-frame cost on
+        # this screen is a single blit
+        levels = player.science.levels
+        spend_key = (player.id, player.money, levels.tobytes())
+        if spend_key != self._max_spend_key:
+            self._max_spend_key = spend_key
+            self._max_spends = np.minimum(
+                (levels ** 3) * 1000, player.money
+            ).astype(np.int64)
+
+            labels = pygame.Surface((490, 6 * 30), pygame.SRCALPHA)
+            y = 0
+            for i in range(1, 7):
+                name, key = _SCIENCE_BRANCHES[i - 1]
+                labels.blit(
+                    self._text(
+                        f"{name}: Level {levels[i - 1]:.1f}",
+                        self.colors[7]
+                    ),
+                    (0, y)
+                )
+                labels.blit(
+                    self._text(
+                        f"Press {key} to spend "
+                        f"(max: {self._max_spends[i - 1]})",
+                        self.colors[14]
+                    ),
+                    (240, y)
+                )
+                y += 30
+            self._science_label_surf = labels.convert_alpha()
+
         # Draw science levels and spending options
-        y = 70
-        for i in range(1, 7):
-            level = player.science.get_level(i)
-            name, key = science_branches[i]
-            
-            # Calculate max spendable amount
-            max_spend = min(player.money, int((level ** 3) * 1000))
-            
-            # Draw level and spending info
-            self.font.render_to(
-                self.screen,
-                (10, y),
-                f"{name}: Level {level:.1f}",
-                self.colors[7]
-            )
-            self.font.render_to(
-                self.screen,
-                (250, y),
-                f"Press {key} to spend (max: {max_spend})",
-                self.colors[14]
-            )
-            y += 30
+        self.screen.blit(self._science_label_surf, (10, 70))
         
         # Draw relative science graph
         graph_x = 500
@@ -906,152 +1041,170 @@ class Interface:
             1
         )
         
-        # Get max science level across all visible players for scaling
-        max_level = 1.0
-        for p in self.all_players.values():
-            if player.can_view_science(p):
-                for i in range(1, 7):
-                    max_level = max(max_level, p.science.get_level(i))
+        # Visibility checks walk the spy and relation tables, so run
+        # them once per player per frame and reuse the answers below
+        can_view = {
+            p.id: player.can_view_science(p)
+            for p in self.all_players.values()
+        }
+
+        # Get max science level across all visible players for scaling;
+        # each player's branches reduce in one C-level max
+        visible_levels = [
+            p.science.levels for p in self.all_players.values()
+            if can_view[p.id]
+        ]
+        max_level = max(1.0, float(np.max(visible_levels))) if visible_levels else 1.0
         
-        # Draw bars for each player
+        # Draw bars for each player: collect the visible bars first,
+        # then issue the fills in one tight loop (hidden players' bars
+        # have zero height, so they are skipped outright)
         bar_width = graph_width / (len(self.all_players) * 6 + len(self.all_players) - 1)
         x = graph_x + 5
-        
+        scale = (graph_height - 10) / max_level
+        bar_base = graph_y + graph_height - 5
+        bars = []
         for p in self.all_players.values():
-            can_view = player.can_view_science(p)
-            for i in range(1, 7):
-                level = p.science.get_level(i) if can_view else 0
-                bar_height = (level / max_level) * (graph_height - 10)
-                
-                # Use black for non-visible science levels
-                color = self.colors[0] if not can_view else self.colors[p.id]
-                
-                pygame.draw.rect(
-                    self.screen,
-                    color,
-                    (x, graph_y + graph_height - bar_height - 5, bar_width - 2, bar_height)
-                )
-                x += bar_width
+            if can_view[p.id]:
+                color = self.colors[p.id]
+                for i in range(1, 7):
+                    bar_height = p.science.get_level(i) * scale
+                    bars.append(
+                        (color, (x, bar_base - bar_height, bar_width - 2, bar_height))
+                    )
+                    x += bar_width
+            else:
+                x += bar_width * 6
             x += bar_width  # Add space between players
+
+        fill = self.screen.fill
+        for color, rect in bars:
+            fill(color, rect)
         
         # Draw legend with spy options
         legend_y = graph_y + graph_height + 10
         x = graph_x
+        colors = self.colors
+        c_spying = colors[2]   # Green
+        c_gold = colors[14]
+        c_hint = colors[7]
+        screen = self.screen
+        render = self.font.render_to
+        spied = player.science.spied_empires
         for p in self.all_players.values():
             if p.id != player.id:  # Don't show spy option for own empire
                 pygame.draw.rect(
-                    self.screen,
-                    self.colors[p.id],
+                    screen,
+                    colors[p.id],
                     (x, legend_y, 20, 20)
                 )
-                
+
                 # Show spy status or cost
-                if player.science.spied_empires.get(p.id, False):
+                is_spying = spied.get(p.id, False)
+                if is_spying:
                     spy_text = "Spying"
-                    text_color = self.colors[2]  # Green
+                    text_color = c_spying
                 else:
                     spy_cost = player.get_spy_cost(p)
                     spy_text = f"Spy ({spy_cost}g)"
-                    text_color = self.colors[14]  # Gold
-                
-                self.font.render_to(
-                    self.screen,
+                    text_color = c_gold
+
+                render(
+                    screen,
                     (x + 25, legend_y + 5),
                     f"{p.name} - {spy_text}",
                     text_color
                 )
-                
+
                 # Add key hint for spying
-                if not player.science.spied_empires.get(p.id, False):
-                    self.font.render_to(
-                        self.screen,
+                if not is_spying:
+                    render(
+                        screen,
                         (x + 150, legend_y + 5),
                         f"(Press {p.id} to spy)",
-                        self.colors[7]
+                        c_hint
                     )
-                
+
                 x += 200
         
         # Instructions
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 40),
-            "Press 1-6 to spend on science",
-            self.colors[14]
+        self.screen.blit(
+            self._text("Press 1-6 to spend on science", self.colors[14]),
+            (10, self.screen_height - 40)
         )
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 20),
-            "Press player number to place spy, ESC to return",
-            self.colors[14]
+        self.screen.blit(
+            self._text(
+                "Press player number to place spy, ESC to return",
+                self.colors[14]
+            ),
+            (10, self.screen_height - 20)
         )
     
     def draw_diplomacy_screen(self, player, all_players):
         """Draw diplomacy management screen"""
         self.screen.fill(self.colors[0])
-        
+
         self.title_font.render_to(
             self.screen,
             (10, 10),
             "Diplomacy",
             self.colors[15]
         )
-        
-        # Diplomatic status names
-        status_names = {
-            1: "War",
-            2: "Hostile",
-            3: "Neutral",
-            4: "Friendly",
-            5: "Allied"
-        }
-        
+
         y = 50
+        colors = self.colors
+        c_name = colors[7]
+        c_negative = colors[4]   # Red color for negative option
+        c_improve = colors[2]    # Green color for improve option
+        blit = self.screen.blit
+        text = self._text
+        relations = player.diplomatic_relations
         for other_player in all_players.values():
             if other_player.id != player.id:
                 # Get current diplomatic status
-                status = player.diplomatic_relations.get(other_player.id, 3)  # Default to Neutral
-                
-                # Draw nation name and current status
-                self.font.render_to(
-                    self.screen,
-                    (10, y),
-                    f"{other_player.name}: {status_names[status]}",
-                    self.colors[7]
+                status = relations.get(other_player.id, 3)  # Default to Neutral
+
+                # Draw nation name and current status; the label surfaces
+                # come from the memoized text cache, so a frame with
+                # unchanged relations does no freetype work
+                blit(
+                    text(
+                        f"{other_player.name}: {_STATUS_NAMES[status]}",
+                        c_name
+                    ),
+                    (10, y)
                 )
-                
-                # Draw options to change relations
-                options = []
-                
+
                 # Option to decrease relations (declare war)
                 if status > 1:  # Can lower if not at war
-                    self.font.render_to(
-                        self.screen,
-                        (300, y),
-                        f"Press {other_player.id} to set negative relations",
-                        self.colors[4]  # Red color for negative option
+                    blit(
+                        text(
+                            f"Press {other_player.id} to set negative relations",
+                            c_negative
+                        ),
+                        (300, y)
                     )
-                
+
                 # Option to increase relations
-                if status < 5:  # Can increase if not already allied
-                    key_list = ["o","p","[","]","l","\\","l",".","/"]
-                if 1 <= other_player.id <= len(key_list):
-                    key = key_list[other_player.id - 1]
+                if 1 <= other_player.id <= len(_DIPLO_KEYS):
+                    key = _DIPLO_KEYS[other_player.id - 1]
                 else:
                     key = '?'
-                self.font.render_to(
-                    self.screen,
-                    (550, y),
-                    f"Press {key} to improve relations",
-                                        self.colors[2]  # Green color for improve option
-                                    )
+                blit(
+                    text(
+                        f"Press {key} to improve relations",
+                        c_improve
+                    ),
+                    (550, y)
+                )
                 y += 30
-                                
-        self.font.render_to(
-            self.screen,
-            (10, self.screen_height - 20),
-            "Press number to declare war, o p [ ] l ; ' , .  to improve relations (one change per nation per turn), ESC to return",
-            self.colors[14]
+
+        self.screen.blit(
+            self._text(
+                "Press number to declare war, o p [ ] l ; ' , .  to improve relations (one change per nation per turn), ESC to return",
+                self.colors[14]
+            ),
+            (10, self.screen_height - 20)
         )
     
     def clear(self):
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
-import random
+from typing import Tuple
+import numpy as np
 from player import Player
 from terrain import TerrainManager
 
@@ -32,6 +32,22 @@ class MilitaryManager:
         self.MILL_SELL = 0.90  # 180
         self.NAVY_SELL = 0.90  # 180
         self.ARMY_SELL = 0.50  # 75
+
+        # Uniform randoms drawn in bulk; battles and revolt checks pop
+        # from the buffer instead of calling into the Mersenne Twister
+        # one value at a time
+        self._rng = np.random.default_rng()
+        self._rng_buf = self._rng.random(4096)
+        self._rng_idx = 0
+
+    def _rand(self) -> float:
+        """Next uniform random in [0, 1) from the batched pool"""
+        if self._rng_idx >= self._rng_buf.shape[0]:
+            self._rng.random(out=self._rng_buf)
+            self._rng_idx = 0
+        value = self._rng_buf[self._rng_idx]
+        self._rng_idx += 1
+        return value
     
     def calculate_battle(
         self,
@@ -44,46 +60,55 @@ class MilitaryManager:
         is_naval: bool = False
     ) -> BattleResult:
         """Calculate the result of a battle between two forces"""
-        
+
+        # Pull the science levels once; the strength math below is pure
+        # scalar arithmetic on these
+        atk_sci = attacker.science
+        def_sci = defender.science
+
         # Base attack strength
         attack_strength = (
-            attack_force * 
-            attacker.science.military * 
-            (0.9 + random.random() * 0.2)  # Random factor 0.9-1.1
+            attack_force *
+            atk_sci.military *
+            (0.9 + self._rand() * 0.2)  # Random factor 0.9-1.1
         )
-        
+
         if is_naval:
-            attack_strength *= attacker.science.sailing
-        
+            attack_strength *= atk_sci.sailing
+
         # Base defense strength
         defense_strength = (
-            defend_force * 
-            defender.science.military * 
-            (0.9 + random.random() * 0.2)  # Random factor 0.9-1.1
+            defend_force *
+            def_sci.military *
+            (0.9 + self._rand() * 0.2)  # Random factor 0.9-1.1
         )
-        
+
         if is_naval:
-            defense_strength *= defender.science.sailing
+            defense_strength *= def_sci.sailing
         else:
             # Apply terrain and fort defense bonuses
             terrain_bonus = self.terrain_manager.get_defense_bonus(terrain_type)
             fort_bonus = fort_level * 0.3
             defense_strength *= (1 + terrain_bonus + fort_bonus)
         
-        # Calculate battle outcome
+        # Calculate battle outcome; both arms share the strength ratio,
+        # and the naval loss curve is symmetric in the weaker side's
+        # ratio, so it is computed once up front
         territory_captured = False
         fort_damage = 0
         population_exchange = 0
-        message = ""
-        
+
+        victory_ratio = attack_strength / defense_strength
+        if is_naval:
+            weaker_ratio = min(victory_ratio, 1 / victory_ratio)
+            winner_losses = 1 - weaker_ratio ** 2 / 3
+            loser_losses = 1 - 1 / 3
+
         if attack_strength > defense_strength:
             # Attacker wins
-            victory_ratio = attack_strength / defense_strength
-            
-            # Calculate losses
             if is_naval:
-                attacker_losses = int(attack_force * (1 - (defense_strength / attack_strength) ** 2 / 3))
-                defender_losses = int(defend_force * (1 - 1 / 3))
+                attacker_losses = int(attack_force * winner_losses)
+                defender_losses = int(defend_force * loser_losses)
                 # Naval victory means destroying enemy navy, allowing for territory capture
                 territory_captured = True
                 defender.navy = max(0, defender.navy - defender_losses)
@@ -91,33 +116,30 @@ class MilitaryManager:
                 attacker_losses = int(attack_force * (1 - victory_ratio / (victory_ratio + 1)))
                 defender_losses = defend_force
                 territory_captured = True
-                
+
                 # Calculate fort damage
                 if fort_level > 0 and defense_strength > attack_strength / 4:
-                    fort_damage = int(fort_level / 2 * random.random() + 0.5)
-                
+                    fort_damage = int(fort_level / 2 * self._rand() + 0.5)
+
                 # Calculate population exchange
                 if defender.population > 0:
                     population_exchange = int(
-                        defender.population * 
-                        self.terrain_manager.get_food_potential(terrain_type) / 
+                        defender.population *
+                        self.terrain_manager.get_food_potential(terrain_type) /
                         max(defender.population, 1)
                     )
-            
+
             message = f"Attacker wins! Losses - Attacker: {attacker_losses}, Defender: {defender_losses}"
-            
+
         else:
             # Defender wins
-            defense_ratio = defense_strength / attack_strength
-            
-            # Calculate losses
             if is_naval:
-                attacker_losses = int(attack_force * (1 - 1 / 3))
-                defender_losses = int(defend_force * (1 - (attack_strength / defense_strength) ** 2 / 3))
+                attacker_losses = int(attack_force * loser_losses)
+                defender_losses = int(defend_force * winner_losses)
             else:
                 attacker_losses = attack_force
-                defender_losses = int(defend_force * (1 - attack_strength / defense_strength))
-            
+                defender_losses = int(defend_force * (1 - victory_ratio))
+
             message = f"Defender wins! Losses - Attacker: {attacker_losses}, Defender: {defender_losses}"
         
         return BattleResult(
@@ -146,7 +168,7 @@ class MilitaryManager:
             max(food_ratio, 0.001) * 
             terrain_food / 
             20 * 
-            random.random() * 
+            self._rand() * 
             (original_owner.morale ** 2)
         )
         
@@ -156,7 +178,7 @@ class MilitaryManager:
         # Revolt chance increases with low morale
         revolt_chance = (1 - owner.morale ** 2) * (revolt_bonus / 5)
         
-        will_revolt = random.random() < revolt_chance
+        will_revolt = bool(self._rand() < revolt_chance)
         
         return will_revolt, revolt_size
     
@@ -168,9 +190,9 @@ class MilitaryManager:
         to_x: int,
         to_y: int,
         owner: Player,
-        army_map: List[List[int]],
-        moved_map: List[List[int]],
-        terrain_map: List[List[int]]
+        army_map: np.ndarray,
+        moved_map: np.ndarray,
+        terrain_map: np.ndarray
     ) -> bool:
         """Move army units from one tile to another"""
         
@@ -180,15 +202,15 @@ class MilitaryManager:
             return False
             
         # Check if enough units available
-        if army_map[from_y][from_x] < amount:
+        if army_map[from_y, from_x] < amount:
             return False
             
         # Only handle land movement
-        if terrain_map[to_y][to_x] == 0:  # Can't move directly to sea
+        if terrain_map[to_y, to_x] == 0:  # Can't move directly to sea
             return False
             
-        army_map[from_y][from_x] -= amount
-        moved_map[to_y][to_x] += amount
+        army_map[from_y, from_x] -= amount
+        moved_map[to_y, to_x] += amount
         return True
     
     def embark_army(
@@ -199,8 +221,8 @@ class MilitaryManager:
         to_x: int,
         to_y: int,
         owner: Player,
-        army_map: List[List[int]],
-        terrain_map: List[List[int]]
+        army_map: np.ndarray,
+        terrain_map: np.ndarray
     ) -> bool:
         """Embark army units onto a sea tile"""
         
@@ -210,11 +232,11 @@ class MilitaryManager:
             return False
             
         # Check if enough units available
-        if army_map[from_y][from_x] < amount:
+        if army_map[from_y, from_x] < amount:
             return False
             
         # Check if destination is sea
-        if terrain_map[to_y][to_x] != 0:  # Not a sea tile
+        if terrain_map[to_y, to_x] != 0:  # Not a sea tile
             return False
             
         # Check naval capacity
@@ -223,6 +245,6 @@ class MilitaryManager:
             
         # Embark the units
         owner.sea_moved += amount
-        army_map[from_y][from_x] -= amount
-        army_map[to_y][to_x] += amount
+        army_map[from_y, from_x] -= amount
+        army_map[to_y, to_x] += amount
         return True
@@ -1,51 +1,108 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import random
+import numpy as np
 
-@dataclass
+# Lookup tables indexed by diplomatic relation level (1-5, index 0
+# unused): spy cost drops to 20% at friendly or allied, and science is
+# visible at the same threshold
+_SPY_COST = (1000, 1000, 1000, 1000, 200, 200)
+_CAN_VIEW = (False, False, False, False, True, True)
+
+@dataclass(slots=True)
 class Science:
-    agriculture: float = 1.0
-    industry: float = 1.0
-    trade: float = 1.0
-    sailing: float = 1.0
-    military: float = 1.0
-    medicine: float = 1.0
-    
+    """Science levels backed by a six-element float array (branches
+    1-6: agriculture, industry, trade, sailing, military, medicine) so
+    indexed access and whole-branch updates stay vectorizable"""
+
+    levels: np.ndarray = field(
+        default_factory=lambda: np.ones(6, dtype=np.float64)
+    )
+
     # Track which empires we are spying on
     spied_empires: Dict[int, bool] = field(default_factory=dict)
-    
+
     def get_level(self, index: int) -> float:
-        """Get science level by index"""
-        if index == 1:
-            return self.agriculture
-        elif index == 2:
-            return self.industry
-        elif index == 3:
-            return self.trade
-        elif index == 4:
-            return self.sailing
-        elif index == 5:
-            return self.military
-        elif index == 6:
-            return self.medicine
+        """Get science level by index (1-6)"""
+        if 1 <= index <= 6:
+            return float(self.levels[index - 1])
         return 0.0
-    
+
     def set_level(self, index: int, value: float):
-        """Set science level by index"""
-        if index == 1:
-            self.agriculture = value
-        elif index == 2:
-            self.industry = value
-        elif index == 3:
-            self.trade = value
-        elif index == 4:
-            self.sailing = value
-        elif index == 5:
-            self.military = value
-        elif index == 6:
-            self.medicine = value
-
-@dataclass
+        """Set science level by index (1-6)"""
+        if 1 <= index <= 6:
+            self.levels[index - 1] = value
+
+    @property
+    def agriculture(self) -> float:
+        return float(self.levels[0])
+
+    @agriculture.setter
+    def agriculture(self, value: float):
+        self.levels[0] = value
+
+    @property
+    def industry(self) -> float:
+        return float(self.levels[1])
+
+    @industry.setter
+    def industry(self, value: float):
+        self.levels[1] = value
+
+    @property
+    def trade(self) -> float:
+        return float(self.levels[2])
+
+    @trade.setter
+    def trade(self, value: float):
+        self.levels[2] = value
+
+    @property
+    def sailing(self) -> float:
+        return float(self.levels[3])
+
+    @sailing.setter
+    def sailing(self, value: float):
+        self.levels[3] = value
+
+    @property
+    def military(self) -> float:
+        return float(self.levels[4])
+
+    @military.setter
+    def military(self, value: float):
+        self.levels[4] = value
+
+    @property
+    def medicine(self) -> float:
+        return float(self.levels[5])
+
+    @medicine.setter
+    def medicine(self, value: float):
+        self.levels[5] = value
+
+class DiplomaticRelations(dict):
+    """Dict of player_id -> relation level (1-5) that keeps a running
+    count of war-level relations so at-war checks are O(1)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.war_count = sum(1 for level in self.values() if level == 1)
+
+    def __setitem__(self, key, value):
+        old = self.get(key)
+        if old == 1:
+            self.war_count -= 1
+        if value == 1:
+            self.war_count += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if self.get(key) == 1:
+            self.war_count -= 1
+        super().__delitem__(key)
+
+@dataclass(slots=True)
 class Player:
     id: int
     name: str = ""
@@ -82,57 +139,60 @@ class Player:
     churches: int = 0
     universities: int = 0
     mills: int = 0
-    
-    def __post_init__(self):
-        self.science = Science()
-        self.diplomatic_relations: Dict[int, int] = {}  # player_id -> relation level (1-5)
-        self.diplomatic_actions: Dict[int, int] = {}  # player_id -> action (-1, 0, 1)
-        self.relations_changed: Dict[int, bool] = {}  # player_id -> whether relations changed this turn
+
+    # Per-player sub-state; declared as fields so the class can carry
+    # __slots__ (no per-instance __dict__)
+    science: Science = field(default_factory=Science)
+    diplomatic_relations: Dict[int, int] = field(
+        default_factory=DiplomaticRelations
+    )  # player_id -> relation level (1-5)
+    diplomatic_actions: Dict[int, int] = field(
+        default_factory=dict
+    )  # player_id -> action (-1, 0, 1)
+    relations_changed: Dict[int, bool] = field(
+        default_factory=dict
+    )  # player_id -> whether relations changed this turn
 
     def distribute_population(self):
         """Distribute population among different working groups"""
         if self.population > 0:
-            # Default distribution:
+            # Default distribution, in pure integer arithmetic:
             # 40% peasants (farming)
             # 20% fishers (sea-based)
             # 25% workers (industry)
             # 10% merchants (trade)
             # 5% unemployed
-            self.peasants = int(self.population * 0.4)
-            self.fishers = int(self.population * 0.2)
-            self.workers = int(self.population * 0.25)
-            self.merchants = int(self.population * 0.1)
+            pop = self.population
+            self.peasants = pop * 40 // 100
+            self.fishers = pop * 20 // 100
+            self.workers = pop * 25 // 100
+            self.merchants = pop * 10 // 100
             # Any remaining population goes to unemployed
-            self.unemployed = (self.population - 
-                (self.peasants + self.fishers + 
-                 self.workers + self.merchants))
+            self.unemployed = pop - (
+                self.peasants + self.fishers +
+                self.workers + self.merchants
+            )
 
     def can_view_science(self, other_player: 'Player') -> bool:
         """Check if we can view another player's science levels"""
         # Always can view our own science
         if self.id == other_player.id:
             return True
-            
-        # Check if we have a spy active
-        if self.science.spied_empires.get(other_player.id, False):
-            return True
-            
-        # Check diplomatic relations
+
+        # Check diplomatic relations first; the spy dict is empty for
+        # most of the game, so its hash probe is skipped entirely then
         relation_level = self.diplomatic_relations.get(other_player.id, 3)  # Default to neutral
-        return relation_level >= 4  # Can view if friendly or allied
-    
+        if _CAN_VIEW[relation_level]:  # Can view if friendly or allied
+            return True
+
+        # Check if we have a spy active
+        spied = self.science.spied_empires
+        return bool(spied) and spied.get(other_player.id, False)
+
     def get_spy_cost(self, other_player: 'Player') -> int:
         """Calculate the cost to place a spy in another empire"""
         relation_level = self.diplomatic_relations.get(other_player.id, 3)  # Default to neutral
-        
-        # Base cost is 1000
-        base_cost = 1000
-        
-        # Reduce cost based on relations
-        if relation_level >= 4:  # Friendly or allied
-            return int(base_cost * 0.2)  # 80% reduction
-        else:
-            return base_cost
+        return _SPY_COST[relation_level]
 
 class PlayerManager:
     def __init__(self):
@@ -155,27 +215,28 @@ class PlayerManager:
     
     def next_player(self) -> Optional[Player]:
         """Get next player in turn order"""
-        # Store initial position to detect full loop
-        start_id = self.current_player_id
-        
-        # Try to find next valid player
-        while True:
-            # Get next ID
-            next_id = self.current_player_id + 1
-            if next_id > self.max_players:
-                next_id = 1
-                
-            # If we've looped back to start, no valid players found
-            if next_id == start_id:
-                return None
-            
-            # Update current ID
-            self.current_player_id = next_id
-            
-            # Check if this is a valid player
-            player = self.get_player(next_id)
-            if player and player.land_count > 0:
-                return player
+        # One pass over the (at most nine) alive players, wrapping
+        # around the id ring
+        ring = sorted(
+            pid for pid, p in self.players.items() if p.land_count > 0
+        )
+        if not ring:
+            return None
+
+        # First alive id after the current one, wrapping to the start
+        for pid in ring:
+            if pid > self.current_player_id:
+                break
+        else:
+            pid = ring[0]
+
+        # The current player being the only survivor means game over,
+        # matching the old scan's behavior
+        if pid == self.current_player_id:
+            return None
+
+        self.current_player_id = pid
+        return self.players[pid]
     
     def calculate_morale(self, player: Player):
         """Calculate player's morale based on various factors"""
@@ -204,29 +265,32 @@ class PlayerManager:
     
     def calculate_income(self, player: Player) -> int:
         """Calculate player's income for the turn"""
-        income = 0
-        
+        # Accumulate in float and truncate once at the end; the
+        # tax/morale product is common to all four population groups,
+        # and industry feeds both worker income and mills
+        eff_tax = (player.tax_rate / 100) * player.morale
+        sci = player.science
+        industry = sci.industry
+
         # Base income from population groups
-        income += int(player.peasants * (player.tax_rate/100) * player.morale * player.science.agriculture * 4)
-        income += int(player.fishers * (player.tax_rate/100) * player.morale * player.science.sailing * 4)
-        income += int(player.workers * (player.tax_rate/100) * player.morale * player.science.industry * 8)
-        income += int(player.merchants * (player.tax_rate/100) * player.morale * player.science.trade * 16)
-        
+        income = player.peasants * eff_tax * sci.agriculture * 4
+        income += player.fishers * eff_tax * sci.sailing * 4
+        income += player.workers * eff_tax * industry * 8
+        income += player.merchants * eff_tax * sci.trade * 16
+
         # Maintenance costs
-        income -= int(player.mills * player.science.industry * 20)  # Mill maintenance
-        income -= int(player.forts * 30)  # Fort maintenance
-        income -= int(player.churches * 3)  # Church maintenance
-        income -= int(player.universities * 25)  # University maintenance
-        income -= int(player.navy * 20)  # Navy maintenance
-        income -= int(player.soldiers * 30)  # Army maintenance
-        
-        # Interest on treasury
-        if player.money > 0:
-            income += int(player.money * 0.04)  # 4% interest on positive balance
-        else:
-            income -= int(abs(player.money) * 0.12)  # 12% interest on debt
-            
-        return income
+        income -= player.mills * industry * 20  # Mill maintenance
+        income -= player.forts * 30  # Fort maintenance
+        income -= player.churches * 3  # Church maintenance
+        income -= player.universities * 25  # University maintenance
+        income -= player.navy * 20  # Navy maintenance
+        income -= player.soldiers * 30  # Army maintenance
+
+        # Interest on treasury: 4% on a positive balance, 12% on debt
+        # (the sign of money makes the debt term subtract naturally)
+        income += player.money * (0.04 if player.money > 0 else 0.12)
+
+        return int(income)
     
     def spend_on_science(self, player: Player, branch: int, amount: int) -> float:
         """Spend money on science branch and return progress made
@@ -237,15 +301,17 @@ class PlayerManager:
             return 0.0
             
         current_level = player.science.get_level(branch)
-        
-        # Calculate spending limit
-        limit = int((current_level ** 3) * 1000)
+
+        # Calculate spending limit; the cubed level feeds both the
+        # limit and the progress divisor, so compute it once
+        level_cubed = current_level ** 3
+        limit = int(level_cubed * 1000)
         amount = min(amount, limit)
-        
+
         # Calculate progress using formula from science.hlp:
         # (spent money) / 10000 / ((sc. level) ^ 3) * (1 + univers. * 50 / popul.)
         uni_factor = 1 + (player.universities / max(player.population, 1) * 50)
-        progress = (amount / 10000 / (current_level ** 3)) * uni_factor
+        progress = (amount / 10000 / level_cubed) * uni_factor
         
         # Cap progress at 0.3
         progress = min(progress, 0.3)
@@ -258,19 +324,17 @@ class PlayerManager:
         return progress
 
     def update_science(self, player: Player):
-        """Update player's science levels"""
-        for i in range(1, 7):
-            current_level = player.science.get_level(i)
-            
-            # Science progress based on universities
-            uni_factor = 1 + (player.universities / max(player.population, 1) * 50)
-            
-            # Base progress rate
-            if player.population >= 100:
-                progress = (1000 / (10000 * current_level ** 3)) * uni_factor
-                progress = min(progress, 0.3)  # Cap progress at 0.3
-                
-                player.science.set_level(i, current_level + progress)
+        """Update player's science levels for all branches at once"""
+        if player.population < 100:
+            return
+
+        # Science progress based on universities
+        uni_factor = 1 + (player.universities / max(player.population, 1) * 50)
+
+        levels = player.science.levels
+        progress = (1000 / (10000 * levels ** 3)) * uni_factor
+        np.minimum(progress, 0.3, out=progress)  # Cap progress at 0.3
+        levels += progress
     
     def change_diplomatic_relation(self, player: Player, target_id: int, change: int) -> bool:
         """Change diplomatic relation level with target player